@@ -0,0 +1,143 @@
+"""
+피드 항목 본문 처리 벤치마크.
+
+create_summary(BeautifulSoup 파싱 1회) + 본문 이미지 추출(BeautifulSoup 파싱 1회)로 항목마다
+두 번 파싱하던 기존 방식과, lxml로 한 번만 파싱하는 process_entry_html을 항목당 CPU 시간으로 비교하고
+두 방식의 요약/이미지가 같은지도 함께 확인합니다.
+
+    # RSS_FEEDS를 한 번 내려받아 저장한 뒤 그 파일로 측정
+    uv run python -m benchmarks.bench_entry_processing --record .cache/feeds
+    uv run python -m benchmarks.bench_entry_processing --feeds .cache/feeds
+
+--feeds를 생략하면 긴 본문을 포함한 합성 피드로 측정합니다.
+"""
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from src.common.config.settings import RSS_FEEDS
+from src.common.http import get_http_client
+from src.shared.database import create_summary, entry_html, process_entry_html, usable_image_src
+
+PARAGRAPH_WORDS = [
+    "서비스", "배포", "쿠버네티스", "latency", "throughput", "캐시", "데이터", "파이프라인",
+    "React", "Kotlin", "장애", "모니터링", "트래픽", "&amp;", "&nbsp;", "API",
+]
+
+
+def legacy_process(entry):
+    html_content = entry_html(entry)
+    summary = create_summary(html_content)
+    link = entry.get("link", "")
+    image = None
+    for img in BeautifulSoup(html_content, "lxml").find_all("img"):
+        image = usable_image_src(img.get("src") or img.get("data-src"), link)
+        if image:
+            break
+    return summary, image
+
+
+def single_parse_process(entry):
+    processed = process_entry_html(entry_html(entry), entry.get("link", ""))
+    return processed.summary, processed.image
+
+
+def feed_file_name(name: str) -> str:
+    return re.sub(r"[^0-9A-Za-z가-힣_-]+", "_", name).strip("_") + ".xml"
+
+
+def record_feeds(directory: Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    client = get_http_client()
+    for feed_config in RSS_FEEDS:
+        try:
+            response = client.get(feed_config["url"], timeout=20)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"skip {feed_config['name']}: {e}")
+            continue
+        (directory / feed_file_name(feed_config["name"])).write_bytes(response.content)
+        print(f"recorded {feed_config['name']} ({len(response.content)} bytes)")
+
+
+def load_recorded_entries(directory: Path) -> list:
+    entries = []
+    for path in sorted(directory.glob("*.xml")):
+        entries.extend(feedparser.parse(path.read_bytes()).entries)
+    return entries
+
+
+def make_synthetic_feed(rng: random.Random, count: int, paragraphs: int) -> bytes:
+    items = []
+    for i in range(count):
+        body = []
+        for p in range(paragraphs):
+            words = " ".join(rng.choice(PARAGRAPH_WORDS) for _ in range(rng.randint(20, 60)))
+            body.append(f"<p>{words}</p>")
+            if p % 7 == 3:
+                body.append(f'<figure><img src="/images/{i}-{p}.png" alt=""></figure>')
+            if p % 11 == 5:
+                body.append("<pre><code>def main():\n    return 0\n</code></pre><!-- ad -->")
+        items.append(
+            f"<item><title>post {i}</title><link>https://example.com/posts/{i}</link>"
+            f"<content:encoded><![CDATA[{''.join(body)}]]></content:encoded></item>"
+        )
+    return (
+        '<?xml version="1.0"?><rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>synthetic</title>{''.join(items)}</channel></rss>"
+    ).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-entry summary/thumbnail processing")
+    parser.add_argument("--feeds", type=Path, help="Directory of recorded feed XML files")
+    parser.add_argument("--record", type=Path, help="Download RSS_FEEDS into this directory and exit")
+    parser.add_argument("--entries", type=int, default=200, help="Synthetic entry count")
+    parser.add_argument("--paragraphs", type=int, default=60, help="Paragraphs per synthetic entry")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    if args.record:
+        record_feeds(args.record)
+        return
+
+    if args.feeds:
+        entries = load_recorded_entries(args.feeds)
+        source = str(args.feeds)
+    else:
+        entries = feedparser.parse(make_synthetic_feed(random.Random(42), args.entries, args.paragraphs)).entries
+        source = "synthetic"
+
+    if not entries:
+        print("no entries found")
+        return
+
+    mismatches = sum(1 for entry in entries if legacy_process(entry) != single_parse_process(entry))
+
+    def run(fn):
+        best = None
+        for _ in range(args.repeat):
+            start = time.process_time()
+            for entry in entries:
+                fn(entry)
+            elapsed = time.process_time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best / len(entries) * 1e6
+
+    legacy_us = run(legacy_process)
+    single_us = run(single_parse_process)
+    avg_kb = sum(len(entry_html(entry)) for entry in entries) / len(entries) / 1024
+
+    print(f"entries: {len(entries)} ({source}, avg {avg_kb:.1f} KB), mismatches: {mismatches}")
+    print(f"legacy (2x BeautifulSoup): {legacy_us:9.1f} us/entry (CPU)")
+    print(f"single lxml parse:         {single_us:9.1f} us/entry (CPU)")
+    print(f"speedup:                   {legacy_us / single_us:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+프롬프트 본문 축소 벤치마크.
+
+Firecrawl 마크다운을 앞에서부터 글자 수로 자르던 기존 방식(공고 30000자, 행사 15000자)과
+잡음 제거 후 토큰 예산에 맞추는 reduce_markdown을 추정 토큰 수와 처리 시간으로 비교합니다.
+--files로 저장해 둔 Firecrawl 마크다운을 주면 실제 페이지로, 없으면 합성 페이지로 측정합니다.
+
+    uv run python -m benchmarks.bench_markdown_reduction
+    uv run python -m benchmarks.bench_markdown_reduction --files .cache/markdown/*.md
+"""
+import argparse
+import random
+import timeit
+from pathlib import Path
+
+from src.shared.markdown_reducer import estimate_tokens, reduce_markdown
+from benchmarks.bench_entry_processing import PARAGRAPH_WORDS
+
+NAV_BLOCK = "\n".join(f"- [메뉴 {i}](https://example.com/menu/{i})" for i in range(12))
+FOOTER_BLOCK = "Copyright © 2024 Example Corp. All rights reserved.\n개인정보처리방침 | 이용약관"
+PLAYER_BLOCK = (
+    "Watch on YouTube\nTap to unmute\n"
+    "If playback doesn't begin shortly, try restarting your device.\nCopy link"
+)
+
+
+def make_page(rng: random.Random, body_chars: int) -> str:
+    parts = ["[Skip to content](#main)", NAV_BLOCK, "# 채용 공고"]
+    length = 0
+    while length < body_chars:
+        words = " ".join(rng.choice(PARAGRAPH_WORDS) for _ in range(rng.randint(15, 40)))
+        part = f"## 섹션\n- {words}\n- 대용량 트래픽 처리 경험\n![img](https://example.com/{rng.randint(0, 999)}.png)"
+        parts.append(part)
+        length += len(part)
+    parts += [PLAYER_BLOCK, NAV_BLOCK, FOOTER_BLOCK]
+    return "\n\n".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark prompt content reduction")
+    parser.add_argument("--files", nargs="*", default=[], help="Saved Firecrawl markdown files")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 60_000], help="Synthetic body sizes")
+    parser.add_argument("--budget", type=int, default=8000, help="Token budget (JOB_PROMPT_TOKEN_BUDGET)")
+    parser.add_argument("--char-limit", type=int, default=30000, help="Legacy character cut")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    if args.files:
+        pages = [(Path(path).name, Path(path).read_text(encoding="utf-8")) for path in args.files]
+    else:
+        rng = random.Random(42)
+        pages = [(f"synthetic-{size}", make_page(rng, size)) for size in args.sizes]
+
+    total_legacy = total_reduced = 0
+    for name, markdown in pages:
+        legacy_tokens = estimate_tokens(markdown[: args.char_limit])
+        reduced = reduce_markdown(markdown, args.budget)
+        seconds = min(timeit.repeat(lambda: reduce_markdown(markdown, args.budget), number=1, repeat=args.repeat))
+        total_legacy += legacy_tokens
+        total_reduced += reduced.tokens_after
+        print(
+            f"{name:>24}: raw {reduced.tokens_before:6d}, legacy cut {legacy_tokens:6d}, "
+            f"reduced {reduced.tokens_after:6d} tokens, {seconds * 1e3:7.2f} ms"
+        )
+
+    if total_legacy:
+        print(f"total: {total_legacy} → {total_reduced} tokens (-{(1 - total_reduced / total_legacy) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+create_summary 벤치마크.
+
+같은 lxml 파싱 위에서 본문 전체 텍스트를 순회한 뒤 앞 200자만 남기는 방식(process_entry_html의 전체 길이 측정 경로)과,
+앞부분 텍스트만 순회하고 멈추는 방식을 본문 크기별로 비교하고 두 요약이 같은지도 함께 확인합니다.
+파서는 양쪽이 같으므로 차이는 조기 중단에서만 나옵니다.
+
+    uv run python -m benchmarks.bench_summary
+"""
+import argparse
+import random
+import timeit
+
+from src.shared.database import process_entry_html
+from benchmarks.bench_entry_processing import PARAGRAPH_WORDS
+
+
+def full_walk_summary(content):
+    return process_entry_html(content, measure_length=True).summary
+
+
+def early_stop_summary(content):
+    return process_entry_html(content).summary
+
+
+def make_body(rng: random.Random, size: int) -> str:
+    parts = []
+    length = 0
+    while length < size:
+        words = " ".join(rng.choice(PARAGRAPH_WORDS) for _ in range(rng.randint(20, 60)))
+        part = f"<p>{words}</p>\n<!-- section -->\n"
+        if rng.random() < 0.2:
+            part += "<pre><code>for i in range(3):\n    print(i)\n</code></pre>\n"
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark create_summary")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000], help="Body sizes in characters")
+    parser.add_argument("--samples", type=int, default=20, help="Bodies per size")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    for size in args.sizes:
+        bodies = [make_body(rng, size) for _ in range(args.samples)]
+        mismatches = sum(1 for body in bodies if early_stop_summary(body) != full_walk_summary(body))
+
+        def run(fn):
+            def _loop():
+                for body in bodies:
+                    fn(body)
+            best = min(timeit.repeat(_loop, number=1, repeat=args.repeat))
+            return best / len(bodies) * 1e6
+
+        full_us = run(full_walk_summary)
+        early_us = run(early_stop_summary)
+        print(
+            f"{size:>6} chars: full-walk {full_us:9.1f} us, early-stop {early_us:9.1f} us, "
+            f"speedup {full_us / early_us:6.2f}x, mismatches {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+generate_tags_fallback 마이크로 벤치마크.
+
+키워드마다 정규식을 만들어 검색하던 기존 구현과, import 시점에 컴파일된 단일 패스 매처를
+10KB 텍스트에서 비교하고 두 구현의 결과가 같은지도 함께 확인합니다.
+
+    uv run python -m benchmarks.bench_tag_fallback
+"""
+import argparse
+import random
+import re
+import timeit
+
+from src.shared.tagger import FALLBACK_KEYWORD_MAP, generate_tags_fallback, merge_and_dedupe
+
+FILLER_WORDS = [
+    "서비스", "개발", "팀", "경험", "우대", "the", "and", "with", "system", "platform",
+    "data", "pipeline", "nodes", "gopher", "reactive", "elastics", "cicd", "ai-ml",
+]
+PUNCTUATION = [" ", " ", " ", ", ", ". ", "\n", " / ", "(", ")", "-"]
+
+
+def legacy_generate_tags_fallback(title, summary, author):
+    combined_text = (title + " " + summary).lower()
+    found_tags = []
+    for keyword, tag in FALLBACK_KEYWORD_MAP.items():
+        pattern = r"(?<![a-zA-Z0-9])" + re.escape(keyword) + r"(?![a-zA-Z0-9])"
+        if re.search(pattern, combined_text):
+            found_tags.append(tag)
+    return merge_and_dedupe(found_tags)[:5]
+
+
+def make_text(rng: random.Random, size: int, keyword_ratio: float) -> str:
+    keywords = list(FALLBACK_KEYWORD_MAP)
+    parts = []
+    length = 0
+    while length < size:
+        if rng.random() < keyword_ratio:
+            word = rng.choice(keywords)
+            if rng.random() < 0.3:
+                word = word.upper()
+        else:
+            word = rng.choice(FILLER_WORDS)
+        part = word + rng.choice(PUNCTUATION)
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)[:size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark generate_tags_fallback")
+    parser.add_argument("--size", type=int, default=10_000, help="Text size in characters")
+    parser.add_argument("--samples", type=int, default=50, help="Number of distinct texts")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    texts = [make_text(rng, args.size, ratio) for ratio in (0.0, 0.01, 0.05) for _ in range(args.samples)]
+
+    mismatches = sum(
+        1 for text in texts
+        if generate_tags_fallback("", text, "") != legacy_generate_tags_fallback("", text, "")
+    )
+
+    def run(fn):
+        def _loop():
+            for text in texts:
+                fn("", text, "")
+        best = min(timeit.repeat(_loop, number=1, repeat=args.repeat))
+        return best / len(texts) * 1e6
+
+    legacy_us = run(legacy_generate_tags_fallback)
+    compiled_us = run(generate_tags_fallback)
+
+    print(f"texts: {len(texts)} x {args.size} chars, mismatches: {mismatches}")
+    print(f"legacy (per-keyword regex): {legacy_us:9.1f} us/call")
+    print(f"compiled single pass:       {compiled_us:9.1f} us/call")
+    print(f"speedup:                    {legacy_us / compiled_us:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,24 @@ def main() -> None:
         default=5,
         help="Maximum number of events to deep-crawl",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass the Firecrawl cache and re-scrape every page",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run, replaying finished items from its journal",
+    )
     args = parser.parse_args()
 
     from src.apps.dev_event.service import run_dev_event_crawler
+    from src.shared.scraping import get_firecrawl_scraper
+
+    get_firecrawl_scraper().refresh = args.refresh
 
-    run_dev_event_crawler(limit=args.limit)
+    run_dev_event_crawler(limit=args.limit, resume=args.resume)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,14 @@
-import requests
 from loguru import logger
 
+from src.common.http import get_http_client
+
 README_URL = "https://raw.githubusercontent.com/brave-people/Dev-Event/master/README.md"
 
 def fetch_dev_event_readme() -> str:
     """Fetch the raw README.md content from the Dev-Event repository."""
     try:
         logger.info(f"Fetching Dev-Event README from {README_URL}...")
-        response = requests.get(README_URL, timeout=30)
+        response = get_http_client().get(README_URL, timeout=30)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -1,53 +1,40 @@
-import time
-import json
-from firecrawl import FirecrawlApp
-import google.generativeai as genai
 from loguru import logger
-from src.common.config.settings import FIRECRAWL_API_KEY, GEMINI_API_KEY
+from src.common.config.settings import EVENT_PROMPT_TOKEN_BUDGET
+from src.common.llm import LLMError, LLMModelNotFoundError, LLMQuotaError, LLMResponseCache, get_gemini_client
+from src.shared.markdown_reducer import reduce_markdown
+from src.shared.scraping import scrape_url_content
 
+EVENT_MODEL = "gemini-2.5-flash"
+EVENT_PROMPT_VERSION = "v1"
 
-def get_firecrawl_client():
-    if not FIRECRAWL_API_KEY:
-        logger.warning("⚠️ FIRECRAWL_API_KEY is missing.")
-        return None
-    return FirecrawlApp(api_key=FIRECRAWL_API_KEY)
+def is_valid_event_analysis(data) -> bool:
+    return isinstance(data, dict) and bool(data.get("description") or data.get("summary"))
 
-def scrape_url_content(url: str):
-    client = get_firecrawl_client()
-    if not client:
-        return None
+event_analysis_cache = LLMResponseCache("dev-events", EVENT_PROMPT_VERSION, validator=is_valid_event_analysis)
 
-    try:
-        # Scrape only proper content
-        # Firecrawl v1/v2 uses .scrape()
-        scrape_result = client.scrape(url, formats=['markdown'])
-        
-        # Handle object or dict response
-        if isinstance(scrape_result, dict):
-            return scrape_result.get('markdown', '')
-        elif hasattr(scrape_result, 'markdown'):
-            return scrape_result.markdown
-        else:
-            logger.warning(f"⚠️ Unexpected Firecrawl response format for {url}")
-            return str(scrape_result)
-
-    except Exception as e:
-        logger.error(f"❌ Firecrawl failed for {url}: {e}")
-        return None
 
 # Global flag to circuit break AI calls if quota is exceeded
 AI_AVAILABLE = True
 
 def process_content_with_gemini(title: str, raw_markdown: str):
     global AI_AVAILABLE
-    
-    if not GEMINI_API_KEY:
+
+    # 메뉴/푸터/유튜브 플레이어 문구 등 잡음을 걷어낸 뒤 토큰 예산에 맞춥니다.
+    reduced = reduce_markdown(raw_markdown, EVENT_PROMPT_TOKEN_BUDGET)
+    logger.info(f"✂️ Prompt content for '{title}': {reduced.report()}")
+
+    # 여러 섹션에 올라온 같은 행사는 이전 분석 결과를 재사용해 Gemini 호출과 대기를 모두 건너뜁니다.
+    cache_key = event_analysis_cache.key(EVENT_MODEL, title, reduced.text)
+    cached = event_analysis_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"💾 Gemini cache hit for event '{title}'")
+        return cached
+
+    client = get_gemini_client()
+    if not client.available:
         logger.warning("⚠️ GEMINI_API_KEY is missing in config.")
         return None
 
-    logger.info(f"🔑 Configuring Gemini with Key: {GEMINI_API_KEY[:5]}... ({len(GEMINI_API_KEY)} chars)")
-    genai.configure(api_key=GEMINI_API_KEY)
-
     if not AI_AVAILABLE:
         # Fail fast if we already know quota is exceeded
         return {
@@ -60,19 +47,13 @@ def process_content_with_gemini(title: str, raw_markdown: str):
             """.strip()
         }
 
-    # Using gemini-1.5-flash as configured
-    model = genai.GenerativeModel("gemini-2.5-flash")
-
-    # Limit chars to avoid token limits
-    truncated_md = raw_markdown[:15000]
-
     prompt = f"""
     You are an expert tech event curator. Analyze the following event information and extract structured data.
     
     Event Title: {title}
     
     Raw Content:
-    {truncated_md}
+    {reduced.text}
     
     Task:
     Extract the following fields into a pure JSON object (Language: Korean):
@@ -105,45 +86,30 @@ def process_content_with_gemini(title: str, raw_markdown: str):
     }}
     """
 
-    max_retries = 3 # Increased retries
-    retry_delay = 5
-
-    for attempt in range(max_retries):
-        try:
-            response = model.generate_content(prompt, generation_config={"response_mime_type": "application/json"})
-            text = response.text.strip()
-            
-            # Basic cleanup
-            if text.startswith("```"):
-                text = text.replace("```json", "").replace("```", "").strip()
-
-            result = json.loads(text)
-            
-            # Handle list response
-            if isinstance(result, list):
-                if len(result) > 0 and isinstance(result[0], dict):
-                    result = result[0]
-                else:
-                    return None
-            
-            logger.info(f"✨ Gemini keys: {list(result.keys())}") 
-            return result
-        except Exception as e:
-            error_str = str(e)
-            if "429" in error_str or "quota" in error_str.lower():
-                logger.error(f"❌ Gemini Quota Exceeded: {e}")
-                logger.warning("🚫 Disabling AI for subsequent events to speed up crawling.")
-                AI_AVAILABLE = False # Trip the circuit breaker
-                break 
-            elif "404" in error_str and "not found" in error_str:
-                 logger.error(f"❌ Gemini Model Not Found: {e}")
-                 # Try to switch? For now just disable
-                 AI_AVAILABLE = False
-                 break
+    try:
+        # 할당량 초과 시 바로 회로를 차단하므로 재시도하지 않습니다.
+        result = client.generate_json(prompt, EVENT_MODEL, max_retries=1)
+
+        # Handle list response
+        if isinstance(result, list):
+            if len(result) > 0 and isinstance(result[0], dict):
+                result = result[0]
             else:
-                logger.error(f"❌ Gemini failed: {e}")
-                break
-    
+                return None
+
+        logger.info(f"✨ Gemini keys: {list(result.keys())}")
+        event_analysis_cache.set(cache_key, result)
+        return result
+    except LLMQuotaError as e:
+        logger.error(f"❌ Gemini Quota Exceeded: {e}")
+        logger.warning("🚫 Disabling AI for subsequent events to speed up crawling.")
+        AI_AVAILABLE = False # Trip the circuit breaker
+    except LLMModelNotFoundError as e:
+        logger.error(f"❌ Gemini Model Not Found: {e}")
+        AI_AVAILABLE = False
+    except LLMError as e:
+        logger.error(f"❌ Gemini failed: {e}")
+
     # FALLBACK: Return raw content if AI fails
     logger.warning("⚠️ Using raw content fallback due to AI failure.")
     return {
@@ -167,12 +133,8 @@ def deep_crawl_event(event):
     raw_md = scrape_url_content(event.link)
     if not raw_md:
         return None
-    
-    # Proactive rate limiting
-    logger.info("⏳ Rate limiting: Waiting 20s to be polite...")
-    time.sleep(20) 
 
-    # 2. Process with Gemini
+    # 2. Process with Gemini - 호출 간격은 공용 Gemini 클라이언트의 모델별 토큰 버킷이 조절합니다.
     result = process_content_with_gemini(event.title, raw_md)
     
     # Inject Content logic
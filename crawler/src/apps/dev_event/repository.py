@@ -1,23 +1,22 @@
 from typing import Any
 
 from src.common.config.settings import DEV_EVENT_JSON_PATH
-from src.common.storage.json_repo import JsonFileRepository
+from src.common.storage.json_repo import JsonFileRepository, jsonl_companion
 
 
 class DevEventRepository:
     def __init__(self, file_path=DEV_EVENT_JSON_PATH):
-        self._repo = JsonFileRepository(file_path)
+        self._repo = JsonFileRepository(file_path, jsonl_path=jsonl_companion(file_path))
 
     @property
     def file_path(self):
         return self._repo.file_path
 
     def load_existing_by_link(self) -> dict[str, dict[str, Any]]:
-        data = self._repo.load_list()
         return {
             item["link"]: item
-            for item in data
-            if isinstance(item, dict) and isinstance(item.get("link"), str)
+            for item in self._repo.iter_records()
+            if isinstance(item.get("link"), str)
         }
 
     def save_all(self, rows: list[dict[str, Any]]) -> None:
@@ -1,12 +1,15 @@
-import time
 import uuid
 
 from loguru import logger
 
 from src.apps.dev_event.fetcher import fetch_dev_event_readme
+from src.apps.dev_event.models import DevEvent
 from src.apps.dev_event.parser import parse_dev_events
-from src.apps.dev_event.processor import deep_crawl_event
+from src.apps.dev_event.processor import deep_crawl_event, event_analysis_cache
 from src.apps.dev_event.repository import DevEventRepository
+from src.common.config.settings import CRAWL_JOURNAL_DIR
+from src.common.http import HostThrottle
+from src.common.storage.journal import RunJournal
 from src.shared.database import fetch_thumbnail_from_web
 
 
@@ -14,9 +17,25 @@ def load_existing_events(repository: DevEventRepository):
     return repository.load_existing_by_link()
 
 
-def run_dev_event_crawler(limit: int = 5, repository: DevEventRepository | None = None):
+def run_dev_event_crawler(
+    limit: int = 5,
+    repository: DevEventRepository | None = None,
+    resume: bool = False,
+    journal: RunJournal | None = None,
+):
+    """
+    Deep Crawl이 끝난 행사는 링크 기준으로 저널에 바로 기록됩니다. resume=True이면 중단된 이전 실행의
+    저널에 있는 행사는 다시 수집하지 않고 기록된 결과를 사용하며(Deep Crawl 한도에도 포함), 저장이 끝나면 저널을 지웁니다.
+    """
     repository = repository or DevEventRepository()
-    logger.info(f"🚀 Starting Dev-Event Crawler (Deep Crawl Limit: {limit})...")
+    journal = journal or RunJournal(CRAWL_JOURNAL_DIR / "dev-event.jsonl")
+    logger.info(f"🚀 Starting Dev-Event Crawler (Deep Crawl Limit: {limit}, resume: {resume})...")
+
+    journaled = journal.load() if resume else {}
+    if resume:
+        logger.info(f"Resuming with {len(journaled)} events from {journal.file_path}.")
+    else:
+        journal.discard()
 
     existing_map = load_existing_events(repository)
     logger.info(f"Loaded {len(existing_map)} existing events.")
@@ -30,8 +49,15 @@ def run_dev_event_crawler(limit: int = 5, repository: DevEventRepository | None
     logger.info(f"Parsed {len(events)} events from README.")
 
     processed_count = 0
+    # 썸네일 캐시 미스로 실제 요청이 나갈 때만 같은 호스트 간격을 둡니다.
+    thumbnail_throttle = HostThrottle(max_per_host=1, min_interval_sec=0.5)
+
+    for index, event in enumerate(events):
+        if event.link in journaled:
+            events[index] = DevEvent.model_validate(journaled[event.link])
+            processed_count += 1
+            continue
 
-    for event in events:
         existing = existing_map.get(event.link)
 
         if existing:
@@ -49,8 +75,7 @@ def run_dev_event_crawler(limit: int = 5, repository: DevEventRepository | None
 
         if not event.thumbnail:
             try:
-                time.sleep(0.5)
-                thumb = fetch_thumbnail_from_web(event.link, "DevEvent")
+                thumb = fetch_thumbnail_from_web(event.link, "DevEvent", thumbnail_throttle)
                 if thumb:
                     event.thumbnail = thumb
             except Exception as e:
@@ -81,10 +106,14 @@ def run_dev_event_crawler(limit: int = 5, repository: DevEventRepository | None
                     event.benefits = ensure_list(result.get("benefits"))
 
                     processed_count += 1
+                    journal.append(event.link, event.model_dump(mode="json"))
             except Exception as e:
                 logger.error(f"Deep crawl failed for {event.title}: {e}")
 
-    save_events_to_json(events, repository)
+    journal.close()
+    logger.info(f"💾 Gemini response cache: {event_analysis_cache.stats_line()}")
+    if save_events_to_json(events, repository):
+        journal.discard()
 
 
 def save_events_to_json(events, repository: DevEventRepository):
@@ -106,6 +135,8 @@ def save_events_to_json(events, repository: DevEventRepository):
 
         repository.save_all(data)
         logger.info(f"✅ Saved {len(events)} events to {repository.file_path}")
+        return True
     except Exception as e:
         logger.error(f"Failed to save JSON: {e}")
+        return False
 
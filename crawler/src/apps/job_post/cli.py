@@ -17,6 +17,11 @@ def _build_parser() -> argparse.ArgumentParser:
         "analyze", help="Analyze a job post URL using Firecrawl + AI"
     )
     analyze_parser.add_argument("url", help="Job post URL")
+    analyze_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass the Firecrawl cache and re-scrape the URL",
+    )
 
     return parser
 
@@ -36,7 +41,9 @@ def main() -> None:
 
     if args.command == "analyze":
         from src.apps.job_post.service import analyze_jd_by_url
+        from src.shared.scraping import get_firecrawl_scraper
 
+        get_firecrawl_scraper().refresh = args.refresh
         result = asyncio.run(analyze_jd_by_url(args.url))
         print(result.model_dump_json(indent=2))
         return
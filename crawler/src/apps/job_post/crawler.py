@@ -1,7 +1,8 @@
-import requests
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from src.common.http import get_http_client
+
 def crawl_job_description(url: str) -> str:
     """
     Crawls a job description URL and extracts the main text content.
@@ -9,12 +10,8 @@ def crawl_job_description(url: str) -> str:
     """
     logger.info(f"🕸️ Crawling JD URL: {url}")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client().get(url, timeout=10)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -9,11 +9,40 @@ def main() -> None:
         default=10,
         help="Maximum number of jobs to process",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore stored jobs: deep-crawl every job and overwrite the JSON file",
+    )
+    parser.add_argument(
+        "--multi-keyword",
+        action="store_true",
+        help="Scan SEARCH_KEYWORDS concurrently instead of the single '개발자' category search",
+    )
+    parser.add_argument(
+        "--keywords",
+        nargs="+",
+        help="Keywords to scan concurrently (implies --multi-keyword)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass the Firecrawl cache and re-scrape every page",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run, replaying finished items from its journal",
+    )
     args = parser.parse_args()
 
-    from src.apps.saramin.service import run_saramin_crawler
+    from src.apps.saramin.service import SEARCH_KEYWORDS, run_saramin_crawler
+    from src.shared.scraping import get_firecrawl_scraper
+
+    get_firecrawl_scraper().refresh = args.refresh
 
-    run_saramin_crawler(limit=args.limit)
+    keywords = args.keywords or (SEARCH_KEYWORDS if args.multi_keyword else None)
+    run_saramin_crawler(limit=args.limit, incremental=not args.full, keywords=keywords, resume=args.resume)
 
 
 if __name__ == "__main__":
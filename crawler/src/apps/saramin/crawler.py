@@ -1,26 +1,78 @@
-import requests
+import hashlib
+import math
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import chain, zip_longest
 from bs4 import BeautifulSoup
-import time
-import random
 from datetime import datetime
 from loguru import logger
 
+from src.common.config.settings import (
+    SARAMIN_KEYWORD_CONCURRENCY,
+    SARAMIN_LIST_CONCURRENCY,
+)
+from src.common.http import get_http_client, get_rate_limiter
+from src.shared.html_markdown import html_to_markdown
+
 from .models import RecruitJob
 
+@dataclass
+class JobDetail:
+    """상세 페이지 본문을 로컬에서 변환한 마크다운과, 충분한 본문인지 판단할 길이 정보입니다."""
+    markdown: str
+    text_length: int      # 이미지 alt를 제외한 본문 글자 수
+    alt_text_length: int  # 이미지 alt 텍스트 글자 수 (이미지형 공고 판별용)
+
+class SeenJobIds:
+    """여러 키워드 스캔이 공유하는 공고 ID(rec_idx) 집합입니다."""
+
+    def __init__(self):
+        self._ids: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def claim(self, jobs: list[RecruitJob], limit: int | None = None) -> list[RecruitJob]:
+        """처음 보는 공고만 최대 limit개까지 등록하고 반환합니다."""
+        new_jobs = []
+        with self._lock:
+            for job in jobs:
+                if limit is not None and len(new_jobs) >= limit:
+                    break
+                if job.id not in self._ids:
+                    self._ids.add(job.id)
+                    new_jobs.append(job)
+        return new_jobs
+
 class SaraminCrawler:
     def __init__(self):
+        self.http = get_http_client()
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Referer': 'https://www.saramin.co.kr/'
         }
         self.api_url = "https://www.saramin.co.kr/zf_user/search/get-recruit-list"
+        self.rate_limiter = get_rate_limiter("saramin")
 
-    def fetch_jobs_by_keyword(self, keyword: str, limit_pages: int = 2) -> list[RecruitJob]:
+    def fetch_jobs_by_keyword(
+        self,
+        keyword: str,
+        limit_pages: int = 2,
+        concurrency: int | None = None,
+        seen: SeenJobIds | None = None,
+        max_jobs: int | None = None,
+    ) -> list[RecruitJob]:
         """
         키워드로 공고 리스트를 수집합니다. (Deep Crawl 전 단계)
+        최대 concurrency개 페이지를 동시에 요청하되 분당 요청 수는 토큰 버킷으로 제한하고,
+        도착한 페이지부터 파싱한 뒤 결과는 페이지 순서대로 합칩니다.
+        빈 페이지를 만나면 그 뒤 페이지는 요청/사용하지 않습니다.
+        seen이 주어지면 처음 보는 공고만 남기고, 이미 알려진 공고만 있는 페이지를 만나면 이 키워드의 페이지 수집을 멈춥니다.
+        max_jobs개가 모이면 남은 페이지는 요청하지 않습니다.
         """
-        jobs = []
-        
+        concurrency = max(1, concurrency or SARAMIN_LIST_CONCURRENCY)
+
         # API 파라미터 구성
         params = {
             'searchType': 'search',
@@ -40,41 +92,145 @@ class SaraminCrawler:
         # 카테고리 필터 (IT/인터넷: 2)
         params['cat_mcls'] = '2' 
 
-        logger.info(f"🔎 Scanning Saramin for keyword: '{keyword}' (Max {limit_pages} pages)")
+        logger.info(
+            f"🔎 Scanning Saramin for keyword: '{keyword}' (Max {limit_pages} pages, concurrency {concurrency})"
+        )
 
-        for page in range(1, limit_pages + 1):
-            params['recruitPage'] = page
-            
-            try:
-                # Random Delay between pages
-                time.sleep(random.uniform(1.0, 2.5))
-                
-                resp = requests.get(self.api_url, params=params, headers=self.headers)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                if not data.get('innerHTML'):
-                    break
-                    
-                soup = BeautifulSoup(data['innerHTML'], 'html.parser')
-                items = soup.find_all('div', class_='item_recruit')
-                
-                if not items:
+        # 도착한 페이지는 파싱 결과만 보관하고, 1페이지부터 빈틈없이 도착한 앞부분만 순서대로 seen에 등록합니다.
+        # 나중에 버려질 수 있는 뒤 페이지의 공고 ID를 미리 등록하면 다른 키워드도 그 공고를 가져가지 못하기 때문입니다.
+        arrived: dict[int, list[RecruitJob] | None] = {}
+        jobs: list[RecruitJob] = []
+        last_page = limit_pages
+        next_page = 1
+        next_to_assemble = 1
+        pending = {}
+
+        def budget_full() -> bool:
+            return max_jobs is not None and len(jobs) >= max_jobs
+
+        def assemble() -> None:
+            nonlocal last_page, next_to_assemble
+            while next_to_assemble <= last_page and next_to_assemble in arrived:
+                if budget_full():
+                    last_page = next_to_assemble - 1
+                    return
+                page = next_to_assemble
+                page_jobs = arrived.pop(page)
+                next_to_assemble += 1
+                if page_jobs is None:
+                    continue
+                remaining = None if max_jobs is None else max_jobs - len(jobs)
+                if seen is None:
+                    page_jobs = page_jobs[:remaining]
+                else:
+                    new_jobs = seen.claim(page_jobs, limit=remaining)
+                    if page_jobs and not new_jobs:
+                        logger.info(f"   ⏹️ '{keyword}' page {page}: only known jobs, stopping")
+                        last_page = min(last_page, page - 1)
+                        return
+                    page_jobs = new_jobs
+                jobs.extend(page_jobs)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while pending or next_page <= last_page:
+                if budget_full():
+                    last_page = min(last_page, next_page - 1)
+                while next_page <= last_page and len(pending) < concurrency:
+                    future = executor.submit(self._fetch_list_page, params, next_page)
+                    pending[future] = next_page
+                    next_page += 1
+
+                if not pending:
                     break
-                    
-                logger.info(f"   📄 Page {page}: Found {len(items)} items")
-                
-                for item in items:
-                    job = self._parse_list_item(item)
-                    if job:
-                        jobs.append(job)
-                        
-            except Exception as e:
-                logger.error(f"❌ Error fetching page {page}: {e}")
-                break
-        
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = pending.pop(future)
+                    try:
+                        item_count, page_jobs = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Error fetching page {page} (giving up after retries): {e}")
+                        arrived[page] = None
+                        continue
+
+                    if item_count == 0:
+                        last_page = min(last_page, page - 1)
+                        continue
+
+                    logger.info(f"   📄 '{keyword}' page {page}: Found {item_count} items")
+                    arrived[page] = page_jobs
+
+                assemble()
+
+        # last_page 뒤에 도착한 페이지는 등록하지 않은 채 버립니다.
+        assemble()
+
+        if self.rate_limiter.throttled:
+            logger.info(
+                f"   🐢 Saramin throttled {self.rate_limiter.throttled} times "
+                f"(current rate: {self.rate_limiter.rate_per_min:.1f}/min)"
+            )
         return jobs
 
+    def discover_jobs(
+        self,
+        keywords: list[str],
+        limit_pages: int = 2,
+        max_jobs: int | None = None,
+        concurrency: int | None = None,
+    ) -> list[RecruitJob]:
+        """
+        여러 키워드를 동시에 스캔하고 rec_idx 기준으로 키워드 간 중복을 제거합니다.
+        모든 키워드가 같은 사람인 토큰 버킷을 공유하므로 전체 요청 속도는 단일 키워드 스캔과 같습니다.
+        max_jobs가 주어지면 키워드마다 max_jobs를 키워드 수로 나눈 만큼만 모으고(남은 페이지는 요청하지 않음),
+        결과는 키워드별로 번갈아 합친 뒤 max_jobs개로 자르므로 앞 키워드가 전체 한도를 차지하지 않습니다.
+        """
+        concurrency = max(1, concurrency or SARAMIN_KEYWORD_CONCURRENCY)
+        seen = SeenJobIds()
+        per_keyword = math.ceil(max_jobs / len(keywords)) if max_jobs and keywords else None
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(self.fetch_jobs_by_keyword, keyword, limit_pages, seen=seen, max_jobs=per_keyword)
+                for keyword in keywords
+            ]
+
+        results = []
+        for keyword, future in zip(keywords, futures):
+            try:
+                keyword_jobs = future.result()
+            except Exception as e:
+                logger.error(f"❌ Keyword scan failed for '{keyword}': {e}")
+                continue
+            logger.info(f"   🔑 '{keyword}': {len(keyword_jobs)} new jobs")
+            results.append(keyword_jobs)
+
+        jobs = [job for job in chain.from_iterable(zip_longest(*results)) if job is not None]
+        return jobs[:max_jobs] if max_jobs else jobs
+
+    def _fetch_list_page(self, params: dict, page: int) -> tuple[int, list[RecruitJob]]:
+        """
+        목록 한 페이지를 요청해 (항목 수, 파싱된 공고)를 반환합니다. 항목 수가 0이면 마지막 페이지를 지난 것입니다.
+        429/5xx와 연결 오류 재시도는 공용 HTTP 클라이언트가 토큰 버킷을 거쳐 수행하므로 여기서는 다시 감싸지 않습니다.
+        """
+        resp = self.http.get(
+            self.api_url,
+            params=dict(params, recruitPage=page),
+            headers=self.headers,
+            timeout=20,
+            rate_limiter=self.rate_limiter,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        if not data.get('innerHTML'):
+            return 0, []
+
+        soup = BeautifulSoup(data['innerHTML'], 'html.parser')
+        items = soup.find_all('div', class_='item_recruit')
+        jobs = [job for job in (self._parse_list_item(item) for item in items) if job]
+        return len(items), jobs
+
     def _parse_list_item(self, item) -> RecruitJob:
         try:
             # 1. ID
@@ -125,17 +281,23 @@ class SaraminCrawler:
         """
         Deep Crawl: 상세 페이지(view-detail)에 직접 접속하여 본문 내용을 가져옵니다.
         """
+        self.fetch_job_detail(job)
+        return job
+
+    def fetch_job_detail(self, job: RecruitJob) -> JobDetail | None:
+        """
+        상세 페이지(view-detail)를 받아 job.content/image_url/content_hash를 채우고,
+        Firecrawl 없이 Gemini에 넘길 수 있도록 본문 마크다운을 함께 반환합니다. 실패하면 None을 반환합니다.
+        """
         if not job.id:
-            return job
+            return None
 
         # Direct iframe URL which contains the real content
         detail_url = f"https://www.saramin.co.kr/zf_user/jobs/relay/view-detail?rec_idx={job.id}"
 
         try:
-            # Polite delay
-            time.sleep(random.uniform(0.5, 1.5))
-            
-            resp = requests.get(detail_url, headers=self.headers, timeout=20)
+            # 목록 수집과 같은 사람인 토큰 버킷을 사용합니다.
+            resp = self.http.get(detail_url, headers=self.headers, timeout=20, rate_limiter=self.rate_limiter)
             resp.raise_for_status()
             
             soup = BeautifulSoup(resp.text, 'html.parser')
@@ -159,22 +321,31 @@ class SaraminCrawler:
             if valid_img_url:
                 job.image_url = valid_img_url
 
+            # Collect alt text from all images, as job description might be split into multiple images
+            alt_texts = [img.get('alt', '').strip() for img in imgs if img.get('alt')]
+
             # Fallback: Image Alt Text (common in Saramin image-only postings)
-            if len(content_text) < 100:
-                # Collect alt text from all images, as job description might be split into multiple images
-                alt_texts = [img.get('alt', '').strip() for img in imgs if img.get('alt')]
-                if alt_texts:
-                     # Join them
-                     content_text += " " + " ".join(alt_texts)
+            if len(content_text) < 100 and alt_texts:
+                content_text += " " + " ".join(alt_texts)
 
             job.content = content_text
+            job.content_hash = hashlib.sha256(content_text.encode("utf-8")).hexdigest()
             
             if len(content_text) > 50:
                  logger.info(f"   ✅ Scraped content for '{job.title[:10]}...' (Length: {len(content_text)})")
             else:
                  logger.warning(f"   ⚠️ Low content length for '{job.title[:10]}...'")
+
+            # 충분한 본문인지는 Gemini에 넘길 마크다운과 같은 노드(공고 본문)로 판단합니다. 페이지 머리말 등은 세지 않습니다.
+            body = soup.select_one('.user_content') or soup.body or soup
+            body_alt_texts = [img.get('alt', '').strip() for img in body.find_all('img') if img.get('alt')]
+            return JobDetail(
+                markdown=html_to_markdown(body),
+                text_length=len(body.get_text(separator=' ', strip=True)),
+                alt_text_length=sum(len(text) for text in body_alt_texts),
+            )
             
         except Exception as e:
             logger.warning(f"   ⚠️ Failed to scrape detail for {job.id}: {e}")
         
-        return job
+        return None
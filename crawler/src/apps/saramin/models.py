@@ -26,6 +26,7 @@ class RecruitJob:
     image_url: Optional[str] = None
     
     scraped_date: str = ""
+    content_hash: str = ""  # 상세 페이지 본문 해시 (증분 수집 시 변경 여부 판단)
 
     def to_dict(self):
         return {
@@ -46,5 +47,6 @@ class RecruitJob:
             "benefits": self.benefits,
             "tags": self.tags,
             "image_url": self.image_url,
-            "scraped_date": self.scraped_date
+            "scraped_date": self.scraped_date,
+            "content_hash": self.content_hash
         }
@@ -0,0 +1,202 @@
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from loguru import logger
+
+from src.apps.saramin.crawler import JobDetail, SaraminCrawler
+from src.apps.saramin.models import RecruitJob
+from src.apps.saramin.processor import (
+    analyze_job_markdown,
+    apply_job_analysis,
+    is_detail_sufficient,
+    resolve_job_markdown,
+)
+from src.common.config.settings import (
+    SARAMIN_DETAIL_WORKERS,
+    SARAMIN_FIRECRAWL_WORKERS,
+    SARAMIN_GEMINI_WORKERS,
+)
+from src.common.storage.journal import RunJournal
+from src.shared.tagger import generate_tags_fallback
+
+_DONE = object()
+
+# 상세 본문이 바뀌지 않은 공고는 이전 실행의 분석 결과만 그대로 가져옵니다. (본문은 이번에 수집한 것을 씁니다)
+CARRY_OVER_FIELDS = ("summary", "responsibilities", "qualifications", "preferred", "benefits", "tags")
+
+
+@dataclass
+class Stage:
+    name: str
+    handler: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class JobTask:
+    job: RecruitJob
+    detail: JobDetail | None = None
+    raw_markdown: str | None = None
+    reused: bool = False
+    from_detail: bool = False
+    rule_based: bool = False
+
+
+def run_stages(items: list[Any], stages: list[Stage], on_item_done: Callable[[int], None] | None = None) -> list[Any]:
+    """
+    items를 stages 순서대로 통과시킵니다. 단계 사이는 큐로 연결되고 단계마다 workers개 스레드가 동시에 처리하므로,
+    앞 단계가 다음 항목을 처리하는 동안 뒤 단계가 이전 항목을 처리합니다.
+    단계에서 예외가 나면 로그만 남기고 항목을 그대로 다음 단계로 넘깁니다. 결과는 입력 순서대로 반환합니다.
+    """
+    inboxes = [queue.Queue() for _ in stages] + [queue.Queue()]
+    remaining = [max(1, stage.workers) for stage in stages]
+    lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        stage = stages[index]
+        inbox, outbox = inboxes[index], inboxes[index + 1]
+        while True:
+            entry = inbox.get()
+            if entry is _DONE:
+                with lock:
+                    remaining[index] -= 1
+                    last_worker = remaining[index] == 0
+                if last_worker:
+                    # 이 단계의 마지막 워커가 끝나면 다음 단계 워커 수만큼 종료 신호를 보냅니다.
+                    next_workers = remaining[index + 1] if index + 1 < len(stages) else 1
+                    for _ in range(next_workers):
+                        outbox.put(_DONE)
+                return
+
+            position, item = entry
+            try:
+                item = stage.handler(item)
+            except Exception as e:
+                logger.error(f"   ❌ Stage '{stage.name}' failed for item {position}: {e}")
+            outbox.put((position, item))
+
+    threads = [
+        threading.Thread(target=worker, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+        for index, stage in enumerate(stages)
+        for n in range(remaining[index])
+    ]
+    for thread in threads:
+        thread.start()
+
+    for position, item in enumerate(items):
+        inboxes[0].put((position, item))
+    for _ in range(remaining[0]):
+        inboxes[0].put(_DONE)
+
+    results: list[Any] = list(items)
+    done = 0
+    while True:
+        entry = inboxes[-1].get()
+        if entry is _DONE:
+            break
+        position, item = entry
+        results[position] = item
+        done += 1
+        if on_item_done:
+            on_item_done(done)
+
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class SaraminJobPipeline:
+    """
+    사람인 공고 상세 수집 파이프라인입니다. (상세 페이지 → Firecrawl → Gemini → 태그 대체)
+    상세 페이지 본문이 충분한 공고는 로컬에서 변환한 마크다운을 쓰고, 이미지형/JS 렌더링 공고만 Firecrawl을 호출합니다.
+    섹션 제목(주요업무/자격요건 등)을 규칙으로 충분히 찾은 공고는 Gemini도 건너뜁니다.
+    단계마다 워커 수를 따로 두고, 외부 서비스 호출은 서비스별 공용 토큰 버킷(get_rate_limiter)을 거치므로
+    전체 처리량이 각 호출 지연/대기의 합이 아니라 가장 느린 서비스의 쿼터에 맞춰집니다.
+    existing(공고 ID → 저장된 공고)이 주어지면 상세 본문 해시가 같은 공고는 Firecrawl/Gemini를 건너뛰고
+    저장된 분석 결과를 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        crawler: SaraminCrawler | None = None,
+        existing: dict[str, dict[str, Any]] | None = None,
+        detail_workers: int = SARAMIN_DETAIL_WORKERS,
+        firecrawl_workers: int = SARAMIN_FIRECRAWL_WORKERS,
+        gemini_workers: int = SARAMIN_GEMINI_WORKERS,
+        journal: RunJournal | None = None,
+    ):
+        self.crawler = crawler or SaraminCrawler()
+        self.existing = existing or {}
+        self.journal = journal
+        self.reused = 0
+        self.firecrawl_skipped = 0
+        self.rule_based = 0
+        self.stages = [
+            Stage("detail", self._scrape_detail, detail_workers),
+            Stage("firecrawl", self._scrape_markdown, firecrawl_workers),
+            Stage("gemini", self._analyze, gemini_workers),
+            Stage("tags", self._fallback_tags, 1),
+        ]
+        if journal is not None:
+            self.stages.append(Stage("journal", self._record, 1))
+
+    def run(self, jobs: list[RecruitJob]) -> list[RecruitJob]:
+        total = len(jobs)
+
+        def report(done: int) -> None:
+            if done % 10 == 0 or done == total:
+                logger.info(f"   Processed {done}/{total}...")
+
+        tasks = run_stages([JobTask(job) for job in jobs], self.stages, on_item_done=report)
+        self.reused = sum(1 for task in tasks if task.reused)
+        self.firecrawl_skipped = sum(1 for task in tasks if task.from_detail)
+        self.rule_based = sum(1 for task in tasks if task.rule_based)
+        return [task.job for task in tasks]
+
+    def _scrape_detail(self, task: JobTask) -> JobTask:
+        task.detail = self.crawler.fetch_job_detail(task.job)
+        task.reused = self._reuse_existing(task.job)
+        return task
+
+    def _reuse_existing(self, job: RecruitJob) -> bool:
+        stored = self.existing.get(job.id)
+        if not stored or not stored.get("summary"):
+            return False
+
+        # 해시가 없는 이전 데이터나 상세 수집에 실패한 공고는 본문이 같은지 알 수 없으므로 다시 분석합니다.
+        if not job.content_hash or stored.get("content_hash") != job.content_hash:
+            return False
+
+        for field_name in CARRY_OVER_FIELDS:
+            if field_name in stored:
+                setattr(job, field_name, stored[field_name])
+        return True
+
+    def _scrape_markdown(self, task: JobTask) -> JobTask:
+        if task.reused:
+            return task
+        task.from_detail = is_detail_sufficient(task.detail)
+        task.raw_markdown = resolve_job_markdown(task.job, task.detail)
+        return task
+
+    def _analyze(self, task: JobTask) -> JobTask:
+        if not task.raw_markdown:
+            return task
+        result, task.rule_based = analyze_job_markdown(task.job, task.raw_markdown)
+        task.job = apply_job_analysis(task.job, result, task.raw_markdown)
+        return task
+
+    def _fallback_tags(self, task: JobTask) -> JobTask:
+        if not task.job.tags:
+            fallback_tags = generate_tags_fallback(task.job.title, task.job.content, task.job.company)
+            if fallback_tags:
+                task.job.tags = fallback_tags
+        return task
+
+    def _record(self, task: JobTask) -> JobTask:
+        # Firecrawl/Gemini 실패로 분석 결과가 없는 공고는 기록하지 않아야 --resume 때 다시 처리됩니다.
+        if task.reused or task.job.summary:
+            self.journal.append(task.job.id, task.job.to_dict())
+        return task
@@ -1,56 +1,45 @@
-import time
-import json
-from firecrawl import FirecrawlApp
-import google.generativeai as genai
 from loguru import logger
-from src.common.config.settings import FIRECRAWL_API_KEY, GEMINI_API_KEY
+from src.apps.saramin.sections import extract_job_sections
+from src.common.config.settings import (
+    JOB_PROMPT_TOKEN_BUDGET,
+    SARAMIN_DETAIL_MIN_CHARS,
+    SARAMIN_SECTION_MIN_CONFIDENCE,
+)
+from src.common.llm import LLMError, LLMResponseCache, get_gemini_client
+from src.shared.markdown_reducer import reduce_markdown
+from src.shared.scraping import scrape_url_content
 
-def get_firecrawl_client():
-    if not FIRECRAWL_API_KEY:
-        logger.warning("⚠️ FIRECRAWL_API_KEY is missing.")
-        return None
-    return FirecrawlApp(api_key=FIRECRAWL_API_KEY)
-
-def scrape_url_content(url: str):
-    """
-    Uses Firecrawl to scrape the given URL and return Markdown content.
-    """
-    client = get_firecrawl_client()
-    if not client:
-        return None
+JOB_MODEL = "gemini-2.0-flash"
+JOB_PROMPT_VERSION = "v1"
+JOB_LIST_FIELDS = ("responsibilities", "qualifications", "preferred", "benefits", "tags")
 
-    try:
-        # Scrape only proper content
-        # Firecrawl v1 uses .scrape()
-        scrape_result = client.scrape(url, formats=['markdown'])
-        
-        # Handle object or dict response
-        if isinstance(scrape_result, dict):
-            return scrape_result.get('markdown', '')
-        elif hasattr(scrape_result, 'markdown'):
-            return scrape_result.markdown
-        else:
-            logger.warning(f"⚠️ Unexpected Firecrawl response format for {url}")
-            return str(scrape_result)
+def is_valid_job_analysis(data) -> bool:
+    if not isinstance(data, dict) or not isinstance(data.get("summary"), str):
+        return False
+    return all(isinstance(data.get(field, []), list) for field in JOB_LIST_FIELDS)
 
-    except Exception as e:
-        logger.error(f"❌ Firecrawl failed for {url}: {e}")
-        return None
+job_analysis_cache = LLMResponseCache("saramin-jobs", JOB_PROMPT_VERSION, validator=is_valid_job_analysis)
 
 def process_job_with_gemini(job_title: str, company: str, raw_markdown: str):
     """
     Uses Gemini to summarize the job posting and extract structured data.
     Returns: JSON Object with fields
     """
-    if not GEMINI_API_KEY:
-        logger.warning("⚠️ GEMINI_API_KEY is missing.")
-        return None
+    # 앞에서부터 글자 수로 자르지 않고, 메뉴/푸터 등 잡음을 걷어낸 뒤 토큰 예산에 맞춥니다.
+    reduced = reduce_markdown(raw_markdown, JOB_PROMPT_TOKEN_BUDGET)
+    logger.info(f"   ✂️ Prompt content for '{job_title}': {reduced.report()}")
 
-    genai.configure(api_key=GEMINI_API_KEY)
-    # Using 2.0-flash as initially intended or 1.5 depending on availability, defaulting to stable fast model
-    model = genai.GenerativeModel("gemini-2.0-flash") 
+    # 같은 공고(재등록 등)는 이전 분석 결과를 재사용해 Gemini 호출과 대기를 모두 건너뜁니다.
+    cache_key = job_analysis_cache.key(JOB_MODEL, job_title, company, reduced.text)
+    cached = job_analysis_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"   💾 Gemini cache hit for job '{job_title}'")
+        return cached
 
-    truncated_md = raw_markdown[:30000]
+    client = get_gemini_client()
+    if not client.available:
+        logger.warning("⚠️ GEMINI_API_KEY is missing.")
+        return None
 
     prompt = f"""
     You are an expert IT Recruiter. Analyze the following Job Posting and extract structured data.
@@ -59,7 +48,7 @@ def process_job_with_gemini(job_title: str, company: str, raw_markdown: str):
     Company: {company}
     
     Raw Content:
-    {truncated_md}
+    {reduced.text}
     
     Task:
     Extract the following fields into a pure JSON object (Language: Korean):
@@ -81,44 +70,64 @@ def process_job_with_gemini(job_title: str, company: str, raw_markdown: str):
     }}
     """
 
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            response = model.generate_content(prompt, generation_config={"response_mime_type": "application/json"})
-            data = json.loads(response.text)
-            
-            # Safely handle if AI returns a list [ {...} ] instead of { ... }
-            if isinstance(data, list):
-                if len(data) > 0 and isinstance(data[0], dict):
-                    return data[0]
-                return {} # Invalid format
-            
-            return data
-        except Exception as e:
-            logger.error(f"❌ Gemini attempt {attempt+1} failed: {e}")
-            time.sleep(5) # Increased retry wait
-            
-    return None
-
-def deep_crawl_job(job):
+    try:
+        data = client.generate_json(prompt, JOB_MODEL, max_retries=3)
+    except LLMError as e:
+        logger.error(f"❌ Gemini failed for job '{job_title}': {e}")
+        return None
+
+    # Safely handle if AI returns a list [ {...} ] instead of { ... }
+    if isinstance(data, list):
+        if len(data) > 0 and isinstance(data[0], dict):
+            data = data[0]
+        else:
+            return {} # Invalid format
+
+    job_analysis_cache.set(cache_key, data)
+    return data
+
+def analyze_job_markdown(job, raw_markdown: str):
     """
-    Orchestrates scraping and processing for a single job.
+    공고 마크다운을 분석해 (결과, 규칙 추출 사용 여부)를 반환합니다.
+    주요업무/자격요건 등 섹션 제목을 규칙으로 찾은 신뢰도가 SARAMIN_SECTION_MIN_CONFIDENCE(%) 이상이면
+    Gemini를 호출하지 않고 추출 결과를 쓰며, 그보다 낮은 공고만 Gemini로 분석합니다.
     """
+    extraction = extract_job_sections(raw_markdown)
+    if extraction.confidence * 100 >= SARAMIN_SECTION_MIN_CONFIDENCE:
+        logger.info(f"   📐 Rule-based sections for '{job.title}' (confidence {extraction.confidence:.2f})")
+        return extraction.to_analysis(job.title, job.company), True
+    return process_job_with_gemini(job.title, job.company, raw_markdown), False
+
+def is_detail_sufficient(detail) -> bool:
+    """
+    상세 페이지 본문만으로 분석할 수 있는지 판단합니다.
+    본문이 SARAMIN_DETAIL_MIN_CHARS자 미만(JS 렌더링 공고)이거나 이미지 alt 텍스트가 본문보다 길면(이미지형 공고)
+    Firecrawl로 다시 가져와야 합니다.
+    """
+    if detail is None or not detail.markdown:
+        return False
+    return detail.text_length >= SARAMIN_DETAIL_MIN_CHARS and detail.alt_text_length <= detail.text_length
+
+def resolve_job_markdown(job, detail=None):
+    """상세 페이지 본문이 충분하면 로컬 변환 마크다운을, 아니면 Firecrawl 마크다운을 반환합니다."""
+    if is_detail_sufficient(detail):
+        logger.info(f"📄 Using Saramin detail markdown: {job.company} - {job.title} (Length: {detail.text_length})")
+        return detail.markdown
+    return scrape_job_markdown(job)
+
+def scrape_job_markdown(job):
+    """Firecrawl로 공고 원문 마크다운을 가져옵니다. 너무 짧거나 실패하면 None을 반환합니다."""
     logger.info(f"🕵️ Deep Crawling: {job.company} - {job.title}")
-    
-    # 1. Scrape (Firecrawl)
+
     raw_md = scrape_url_content(job.link)
-    
+
     if not raw_md or len(raw_md) < 50:
         logger.warning(f"   ⚠️ Content too short or failed for {job.id}")
-        return job
-    
-    # Ratelimit - Increased to 10s to avoid 429 Resource Exhausted
-    time.sleep(10) 
+        return None
+    return raw_md
 
-    # 2. Process (Gemini)
-    result = process_job_with_gemini(job.title, job.company, raw_md)
-    
+def apply_job_analysis(job, result, raw_md: str):
+    """Gemini 분석 결과를 공고 필드에 반영합니다."""
     if result and isinstance(result, dict):
         # Populate new fields
         job.summary = result.get("summary", "")
@@ -144,3 +153,17 @@ def deep_crawl_job(job):
         logger.info(f"   ✅ Processed: {job.title} (R:{len(job.responsibilities)}, Q:{len(job.qualifications)})")
     
     return job
+
+def deep_crawl_job(job, detail=None):
+    """
+    Orchestrates scraping and processing for a single job.
+    detail(SaraminCrawler.fetch_job_detail 결과)이 충분하면 Firecrawl을 호출하지 않습니다.
+    """
+    # 1. Scrape (상세 페이지 본문 또는 Firecrawl)
+    raw_md = resolve_job_markdown(job, detail)
+    if not raw_md:
+        return job
+
+    # 2. Process (규칙 추출 또는 Gemini) - Gemini 호출 간격은 공용 클라이언트의 모델별 토큰 버킷이 조절합니다.
+    result, _ = analyze_job_markdown(job, raw_md)
+    return apply_job_analysis(job, result, raw_md)
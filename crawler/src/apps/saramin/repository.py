@@ -1,12 +1,12 @@
-from typing import Any
+from typing import Any, Iterator
 
 from src.common.config.settings import SARAMIN_JOBS_JSON_PATH
-from src.common.storage.json_repo import JsonFileRepository
+from src.common.storage.json_repo import JsonFileRepository, jsonl_companion
 
 
 class SaraminRepository:
     def __init__(self, file_path=SARAMIN_JOBS_JSON_PATH):
-        self._repo = JsonFileRepository(file_path)
+        self._repo = JsonFileRepository(file_path, jsonl_path=jsonl_companion(file_path))
 
     @property
     def file_path(self):
@@ -15,6 +15,6 @@ class SaraminRepository:
     def save_all(self, rows: list[dict[str, Any]]) -> None:
         self._repo.save_list(rows)
 
-    def load_all(self) -> list[dict[str, Any]]:
-        return self._repo.load_list()
+    def iter_all(self) -> Iterator[dict[str, Any]]:
+        return self._repo.iter_records()
 
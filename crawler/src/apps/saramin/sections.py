@@ -0,0 +1,150 @@
+import re
+from dataclasses import dataclass, field
+
+# 섹션 제목으로 인정할 표현 (공백 제거 후 비교합니다)
+SECTION_KEYWORDS = {
+    "responsibilities": ("주요업무", "담당업무", "업무내용", "수행업무", "하는일", "합류하면할일", "responsibilities", "whatyouwilldo"),
+    "qualifications": ("자격요건", "지원자격", "필수요건", "필수자격", "자격조건", "requirements", "qualifications"),
+    "preferred": ("우대사항", "우대조건", "우대요건", "preferred", "nicetohave"),
+    "benefits": ("복리후생", "복지", "복지및혜택", "복지혜택", "혜택및복지", "혜택", "benefits", "perks"),
+}
+# 위 섹션을 끝내는 다른 섹션 제목
+STOP_KEYWORDS = (
+    "근무조건", "근무환경", "근무지", "근무시간", "근무형태", "고용형태", "급여", "전형절차", "채용절차", "접수기간",
+    "접수방법", "지원방법", "제출서류", "기타", "유의사항", "참고사항", "회사소개", "기업소개", "모집부문", "모집분야",
+)
+# 섹션별 가중치 - 주요업무와 자격요건이 모두 있어야 기본 기준(0.7)을 넘습니다.
+SECTION_WEIGHTS = {"responsibilities": 0.35, "qualifications": 0.35, "preferred": 0.15, "benefits": 0.15}
+
+HEADING_STRIP_CHARS = " #*_[]()【】<>「」『』■□●○◆◇▶▷►•·:：-|"
+ITEM_MARKER_PATTERN = re.compile(r"^(?:[-*+•·▪◦○●■□◆◇▶▷►✔✓※ㆍ]|\d+[.)]|[①-⑳])\s*")
+LIST_ITEM_PATTERN = re.compile(r"^[-*+•·]\s")
+MAX_HEADING_EXTRA_CHARS = 4
+MAX_ITEMS = 20
+MAX_ITEM_CHARS = 300
+
+
+@dataclass
+class SectionExtraction:
+    responsibilities: list[str] = field(default_factory=list)
+    qualifications: list[str] = field(default_factory=list)
+    preferred: list[str] = field(default_factory=list)
+    benefits: list[str] = field(default_factory=list)
+
+    @property
+    def confidence(self) -> float:
+        return sum(weight for name, weight in SECTION_WEIGHTS.items() if getattr(self, name))
+
+    def to_analysis(self, job_title: str, company: str) -> dict:
+        """process_job_with_gemini 결과와 같은 형태로 바꿉니다. 요약은 주요 업무 앞부분으로 만듭니다."""
+        duties = ", ".join(item[:40] for item in self.responsibilities[:2])
+        summary = f"{company}의 {job_title} 포지션입니다."
+        if duties:
+            summary += f" 주요 업무는 {duties} 등입니다."
+        return {
+            "summary": summary,
+            "responsibilities": self.responsibilities,
+            "qualifications": self.qualifications,
+            "preferred": self.preferred,
+            "benefits": self.benefits,
+            "tags": [],
+        }
+
+
+def _normalize_heading(text: str) -> str:
+    # "자격요건 (필수)", "주요 업무(Role)"처럼 괄호로 덧붙인 설명은 무시합니다.
+    text = re.sub(r"[(（][^)）]*[)）]", "", text)
+    text = re.sub(r"^\d+[.)]\s*", "", text.strip().strip(HEADING_STRIP_CHARS))
+    return re.sub(r"\s+", "", text.strip(HEADING_STRIP_CHARS)).lower()
+
+
+def _heading_matches(normalized: str, keyword: str) -> bool:
+    # "복지", "급여"처럼 짧은 제목은 "복지포인트" 같은 항목과 구분하기 위해 정확히 일치할 때만 인정합니다.
+    if len(keyword) <= 2:
+        return normalized == keyword
+    return normalized.startswith(keyword) and len(normalized) <= len(keyword) + MAX_HEADING_EXTRA_CHARS
+
+
+def match_heading(text: str) -> str | None:
+    """줄이 섹션 제목이면 섹션 이름을, 다른 섹션(근무조건 등) 제목이면 "other"를, 아니면 None을 반환합니다."""
+    if LIST_ITEM_PATTERN.match(text.strip()):
+        return None
+    normalized = _normalize_heading(text)
+    if not normalized:
+        return None
+    for name, keywords in SECTION_KEYWORDS.items():
+        if any(_heading_matches(normalized, keyword) for keyword in keywords):
+            return name
+    if any(_heading_matches(normalized, keyword) for keyword in STOP_KEYWORDS):
+        return "other"
+    return None
+
+
+def clean_item(text: str) -> str:
+    text = text.replace("**", "").strip()
+    while True:
+        stripped = ITEM_MARKER_PATTERN.sub("", text).strip()
+        if stripped == text:
+            break
+        text = stripped
+    return re.sub(r"\s+", " ", text)[:MAX_ITEM_CHARS]
+
+
+def _split_cell_items(text: str) -> list[str]:
+    # 표 셀은 줄바꿈이 공백으로 합쳐지므로 목록 기호 기준으로 다시 나눕니다.
+    parts = re.split(r"\s+(?=[-•·▪※ㆍ]\s)|\s+(?=\d+[.)]\s)", text)
+    return [part for part in parts if part.strip()]
+
+
+def extract_job_sections(markdown: str) -> SectionExtraction:
+    """
+    공고 마크다운에서 주요업무/자격요건/우대사항/복리후생 섹션을 제목으로 찾아 항목을 추출합니다.
+    "주요업무: ..."처럼 제목과 내용이 한 줄에 있거나 "| 주요업무 | ... |" 표 행으로 된 경우도 처리합니다.
+    """
+    extraction = SectionExtraction()
+    current: str | None = None
+
+    def add(name: str | None, raw_items: list[str]) -> None:
+        if name is None or name == "other":
+            return
+        items = getattr(extraction, name)
+        for raw in raw_items:
+            item = clean_item(raw)
+            if len(item) >= 2 and item not in items and len(items) < MAX_ITEMS:
+                items.append(item)
+
+    for line in (markdown or "").split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if stripped.startswith("|"):
+            cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+            name = match_heading(cells[0]) if cells else None
+            if name:
+                current = name
+                add(name, [item for cell in cells[1:] for item in _split_cell_items(cell)])
+                continue
+
+        name = match_heading(stripped)
+        if name is None and re.match(r"^[^:：]{2,20}[:：]", stripped):
+            heading, _, rest = re.split(r"([:：])", stripped, maxsplit=1)
+            name = match_heading(heading)
+            if name:
+                current = name
+                add(name, [rest])
+                continue
+        if name:
+            current = name
+            continue
+
+        if stripped.startswith("#"):
+            # 인식하지 못한 마크다운 제목은 새 섹션의 시작으로 보고 현재 섹션을 끝냅니다.
+            current = None
+            continue
+        if re.fullmatch(r"\*\*[^*]+\*\*", stripped):
+            # 섹션 안의 굵은 소제목(예: **[백엔드]**)은 항목으로 넣지 않습니다.
+            continue
+        add(current, [stripped])
+
+    return extraction
@@ -2,23 +2,54 @@ from loguru import logger
 
 from src.apps.saramin.crawler import SaraminCrawler
 from src.apps.saramin.models import RecruitJob
-from src.apps.saramin.processor import deep_crawl_job
+from src.apps.saramin.pipeline import SaraminJobPipeline
+from src.apps.saramin.processor import job_analysis_cache
 from src.apps.saramin.repository import SaraminRepository
-from src.shared.tagger import generate_tags_fallback
+from src.common.config.settings import CRAWL_JOURNAL_DIR
+from src.common.storage.journal import RunJournal
 
 SEARCH_KEYWORDS = ["Frontend", "Backend", "Mobile", "AI/ML", "DevOps"]
 
 
-def run_saramin_crawler(limit: int = 10, repository: SaraminRepository | None = None):
+def run_saramin_crawler(
+    limit: int = 10,
+    repository: SaraminRepository | None = None,
+    incremental: bool = True,
+    keywords: list[str] | None = None,
+    resume: bool = False,
+    journal: RunJournal | None = None,
+):
+    """
+    keywords가 주어지면 여러 키워드를 동시에 스캔해 키워드 간 중복을 제거하며 공고를 모읍니다.
+    incremental=True이면 저장된 공고를 불러와 상세 본문이 바뀌지 않은 공고는 Deep Crawl 결과를 재사용하고,
+    이번 결과를 저장된 공고 목록에 병합해 저장합니다.
+    분석까지 끝난(또는 저장된 결과를 재사용한) 공고는 저널에 바로 기록되며, resume=True이면 중단된 이전 실행의 저널에 있는 공고는
+    다시 수집하지 않고 기록된 결과를 사용합니다. 저장이 끝나면 저널을 지웁니다.
+    """
     repository = repository or SaraminRepository()
-    logger.info(f"🚀 Starting Saramin Crawler (Limit: {limit})...")
+    journal = journal or RunJournal(CRAWL_JOURNAL_DIR / "saramin.jsonl")
+    logger.info(f"🚀 Starting Saramin Crawler (Limit: {limit}, incremental: {incremental}, resume: {resume})...")
+
+    journaled = journal.load() if resume else {}
+    if resume:
+        logger.info(f"Resuming with {len(journaled)} jobs from {journal.file_path}.")
+    else:
+        journal.discard()
+
+    existing = {row["id"]: row for row in repository.iter_all() if row.get("id")} if incremental else {}
+    if incremental:
+        logger.info(f"Loaded {len(existing)} stored jobs.")
 
     crawler = SaraminCrawler()
     job_map = {}
 
-    logger.info("🔍 Phase 1: Searching for 'IT General' (Category Scan)...")
     target_pages = (limit // 40) + 2
-    jobs = crawler.fetch_jobs_by_keyword("개발자", limit_pages=target_pages)
+    if keywords:
+        logger.info(f"🔍 Phase 1: Searching {len(keywords)} keywords {keywords}...")
+        jobs = crawler.discover_jobs(keywords, limit_pages=target_pages, max_jobs=limit)
+    else:
+        logger.info("🔍 Phase 1: Searching for 'IT General' (Category Scan)...")
+        jobs = crawler.fetch_jobs_by_keyword("개발자", limit_pages=target_pages)
 
     for job in jobs:
         if job.id not in job_map:
@@ -30,36 +61,42 @@ def run_saramin_crawler(limit: int = 10, repository: SaraminRepository | None =
     logger.info(f"✅ Phase 1 Complete. {len(unique_jobs)} unique jobs selected for Deep Crawl.")
 
     logger.info("🕷️ Phase 2: Deep Crawling & Tagging...")
-    processed_jobs = []
-
-    for i, job in enumerate(unique_jobs):
-        if i % 10 == 0:
-            logger.info(f"   Processing {i}/{len(unique_jobs)}...")
-
-        try:
-            job = crawler.scrape_job_detail(job)
-        except Exception as e:
-            logger.warning(f"   ⚠️ Legacy scrape failed for {job.id}: {e}")
-
-        try:
-            job = deep_crawl_job(job)
-        except Exception as e:
-            logger.error(f"   ❌ Deep crawl failed for {job.id}: {e}")
-
-        if not job.tags:
-            fallback_tags = generate_tags_fallback(job.title, job.content, job.company)
-            if fallback_tags:
-                job.tags = fallback_tags
-
-        processed_jobs.append(job)
+    pending_jobs = [job for job in unique_jobs if job.id not in journaled]
+    pipeline = SaraminJobPipeline(crawler, existing=existing, journal=journal)
+    crawled = {job.id: job for job in pipeline.run(pending_jobs)}
+    journal.close()
+
+    # 저널에만 있는 공고(이번 목록에서 빠진 공고)도 이미 비용을 들여 처리했으므로 결과에 포함합니다.
+    order = [job.id for job in unique_jobs] + [job_id for job_id in journaled if job_id not in job_map]
+    processed_jobs = [crawled[job_id] if job_id in crawled else RecruitJob(**journaled[job_id]) for job_id in order]
+    logger.info(
+        f"   ♻️ Reused {pipeline.reused} unchanged jobs, replayed {len(journaled)} from journal, "
+        f"deep-crawled {len(crawled) - pipeline.reused}."
+    )
+    logger.info(f"   📄 Used Saramin detail markdown for {pipeline.firecrawl_skipped} jobs (Firecrawl skipped).")
+    logger.info(f"   📐 Rule-based section extraction for {pipeline.rule_based} jobs (Gemini skipped).")
+    logger.info(f"   💾 Gemini response cache: {job_analysis_cache.stats_line()}")
 
     logger.info("💾 Phase 3: Saving to JSON...")
-    save_jobs_to_json(processed_jobs, repository)
+    if incremental:
+        rows = merge_jobs(existing, processed_jobs)
+        repository.save_all(rows)
+        logger.info(f"Saved {len(rows)} jobs ({len(processed_jobs)} from this run) to {repository.file_path}")
+    else:
+        save_jobs_to_json(processed_jobs, repository)
+    journal.discard()
     logger.info("🎉 Saramin Crawler Finished!")
 
 
+def merge_jobs(existing: dict[str, dict], jobs: list[RecruitJob]) -> list[dict]:
+    """이번 실행 공고를 앞에 두고, 이번에 수집되지 않은 저장 공고(공고 ID → 행)를 기존 순서대로 뒤에 붙입니다."""
+    rows = [job.to_dict() for job in jobs]
+    seen = {row["id"] for row in rows}
+    rows.extend(row for job_id, row in existing.items() if job_id not in seen)
+    return rows
+
+
 def save_jobs_to_json(jobs: list[RecruitJob], repository: SaraminRepository):
     data = [job.to_dict() for job in jobs]
     repository.save_all(data)
     logger.info(f"Saved {len(jobs)} jobs to {repository.file_path}")
-
@@ -3,11 +3,22 @@ import argparse
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Tech Blog crawler CLI")
-    parser.parse_args()
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of feeds fetched in parallel (default: FEED_FETCH_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Rebuild the local dedup index from the full blogs table",
+    )
+    args = parser.parse_args()
 
     from src.apps.tech_blog.crawler import run_tech_blog_crawler
 
-    run_tech_blog_crawler()
+    run_tech_blog_crawler(concurrency=args.concurrency, rebuild_index=args.rebuild_index)
 
 
 if __name__ == "__main__":
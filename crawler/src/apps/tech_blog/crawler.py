@@ -1,62 +1,106 @@
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 
 import feedparser
-import requests
 
-from src.apps.tech_blog.repository import TechBlogRepository
-from src.common.config.settings import RSS_FEEDS, TAG_REQUEST_DELAY_MS
-from src.shared.database import create_summary, extract_thumbnail, normalize_url
-from src.shared.tagger import base_tags_from_feed_category, generate_tags_for_article
-
-
-def get_existing_data(repository: TechBlogRepository):
+from src.apps.tech_blog.dedup_index import DedupIndex, author_title_key
+from src.apps.tech_blog.repository import FeedValidatorRepository, TechBlogRepository
+from src.common.config.settings import (
+    FEED_FETCH_CONCURRENCY,
+    FEED_HOST_DELAY_MS,
+    FEED_PER_HOST_CONCURRENCY,
+    RSS_FEEDS,
+    THUMBNAIL_CONCURRENCY,
+    THUMBNAIL_PER_HOST_CONCURRENCY,
+)
+from src.common.http import HostThrottle, get_http_client
+from src.shared.database import (
+    entry_html,
+    extract_feed_thumbnail,
+    fetch_thumbnail_from_web,
+    needs_web_thumbnail,
+    normalize_url,
+    process_entry_html,
+)
+from src.shared.tagger import (
+    base_tags_from_feed_category,
+    generate_tags_for_articles,
+    get_tag_cache,
+)
+
+
+def load_dedup_index(repository: TechBlogRepository, rebuild: bool = False) -> DedupIndex:
     print("📋 Checking existing data...")
-    url_set = set()
-    author_title_map = {}
+    dedup_index = DedupIndex()
 
     try:
-        all_data = repository.fetch_existing_articles()
-        print(f"✅ Loaded total {len(all_data)} articles")
-
-        for item in all_data:
-            if item.get("external_url"):
-                url_set.add(normalize_url(item["external_url"]))
-
-            if item.get("title") and item.get("author"):
-                key = f"{item['author']}:{item['title']}"
-                author_title_map[key] = item
-
-        return url_set, author_title_map
+        mode = "full rebuild" if rebuild or dedup_index.watermark is None else "incremental"
+        fetched = dedup_index.sync(repository, rebuild=rebuild)
+        print(f"✅ Synced dedup index ({mode}): fetched {fetched} rows")
     except Exception as e:
-        print(f"❌ Error fetching existing data: {e}")
-        return set(), {}
+        print(f"❌ Error syncing dedup index, using local copy: {e}")
+
+    return dedup_index
 
 
-def is_duplicate(article, url_set, author_title_map):
-    if article["external_url"] in url_set:
+def is_duplicate(article, dedup_index: DedupIndex):
+    if dedup_index.has_url(article["external_url"]):
         return True, "URL duplicate"
 
-    key = f"{article['author']}:{article['title']}"
-    if key in author_title_map:
+    if dedup_index.has_author_title(article["author"], article["title"]):
         return True, "Author+Title duplicate"
 
     return False, None
 
 
-def parse_feed(feed_config):
-    print(f"📡 Parsing feed: {feed_config['name']}...")
+@dataclass
+class FeedFetchResult:
+    content: bytes | None
+    not_modified: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def fetch_feed(
+    feed_config,
+    throttle: HostThrottle | None = None,
+    validators: FeedValidatorRepository | None = None,
+) -> FeedFetchResult | None:
+    """
+    피드 원문만 다운로드합니다. 실패 시 None을 반환합니다.
+    throttle이 주어지면 호스트별 동시성/간격 제한 안에서 요청하고,
+    validators가 주어지면 조건부 GET을 보내 304 응답 시 not_modified로 표시합니다.
+    """
+    print(f"📡 Fetching feed: {feed_config['name']}...")
+    headers = validators.conditional_headers(feed_config["url"]) if validators is not None else {}
+
     try:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-        }
-        resp = requests.get(feed_config["url"], headers=headers, timeout=20)
+        resp = get_http_client().get(feed_config["url"], headers=headers, timeout=20, throttle=throttle)
+
+        if resp.status_code == 304:
+            print(f"⏭️ {feed_config['name']}: Not modified since last run")
+            return FeedFetchResult(content=None, not_modified=True)
+
         resp.raise_for_status()
+        return FeedFetchResult(
+            content=resp.content,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+    except Exception as e:
+        print(f"❌ Failed to fetch {feed_config['name']}: {e}")
+        return None
+
 
-        feed = feedparser.parse(resp.content)
+def parse_feed_content(feed_config, content):
+    """피드 본문을 기사 목록으로 변환합니다. 파싱에 실패하면 None을 반환합니다(항목이 없는 피드는 빈 목록)."""
+    print(f"📡 Parsing feed: {feed_config['name']}...")
+    try:
+        feed = feedparser.parse(content)
+        if feed.bozo and not feed.entries:
+            print(f"❌ Failed to parse {feed_config['name']}: {feed.get('bozo_exception')}")
+            return None
         articles = []
 
         for entry in feed.entries:
@@ -71,19 +115,15 @@ def parse_feed(feed_config):
             elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
                 pub_date = datetime(*entry.updated_parsed[:6])
 
-            summary = create_summary(
-                entry.get("content", [{"value": ""}])[0]["value"]
-                if "content" in entry
-                else entry.get("summary", ""),
-                feed_config,
-                entry,
-            )
+            # 본문 HTML을 한 번만 파싱해 요약과 본문 이미지를 함께 얻습니다.
+            processed = process_entry_html(entry_html(entry), entry.link)
 
-            thumbnail_url = extract_thumbnail(entry, feed_config)
+            # 원문 스크래핑이 필요한 썸네일은 중복 제거 후 resolve_web_thumbnails에서 병렬로 처리합니다.
+            thumbnail_url = extract_feed_thumbnail(entry, processed)
 
             article = {
                 "title": (entry.get("title") or "No Title").strip(),
-                "summary": summary,
+                "summary": processed.summary,
                 "author": feed_config["name"],
                 "external_url": normalized_url,
                 "published_at": pub_date.isoformat(),
@@ -98,13 +138,43 @@ def parse_feed(feed_config):
         return articles
     except Exception as e:
         print(f"❌ Failed to parse {feed_config['name']}: {e}")
+        return None
+
+
+def parse_feed(feed_config):
+    result = fetch_feed(feed_config)
+    if result is None or result.content is None:
         return []
+    return parse_feed_content(feed_config, result.content) or []
+
+
+_thumbnail_throttle = HostThrottle(max_per_host=THUMBNAIL_PER_HOST_CONCURRENCY)
+
+
+def resolve_web_thumbnails(articles, blog_name):
+    """
+    원문 og:image가 필요한 글들의 썸네일을 도메인별 동시성 제한 안에서 병렬로 가져옵니다.
+    찾지 못하면 피드에서 얻은 썸네일을 그대로 유지합니다.
+    """
+    targets = [article for article in articles if needs_web_thumbnail(article["external_url"])]
+    if not targets:
+        return
+
+    print(f"🔍 [{blog_name} Thumbnail] Resolving {len(targets)} thumbnails from web...")
+    with ThreadPoolExecutor(max_workers=min(THUMBNAIL_CONCURRENCY, len(targets))) as executor:
+        futures = {
+            executor.submit(fetch_thumbnail_from_web, article["external_url"], blog_name, _thumbnail_throttle): article
+            for article in targets
+        }
+        for future in as_completed(futures):
+            thumbnail = future.result()
+            if thumbnail:
+                futures[future]["thumbnail_url"] = thumbnail
 
 
 def insert_articles(
     articles,
-    url_set,
-    author_title_map,
+    dedup_index: DedupIndex,
     feed_name,
     repository: TechBlogRepository,
 ):
@@ -113,27 +183,28 @@ def insert_articles(
 
     new_articles = []
     duplicate_count = 0
+    batch_urls = set()
+    batch_keys = set()
 
     for article in articles:
-        is_dup, reason = is_duplicate(article, url_set, author_title_map)
-        if is_dup:
+        key = author_title_key(article["author"], article["title"])
+        is_dup, reason = is_duplicate(article, dedup_index)
+        if is_dup or article["external_url"] in batch_urls or key in batch_keys:
             duplicate_count += 1
         else:
-            if not article["tags"]:
-                ai_tags = generate_tags_for_article(article)
-                if ai_tags:
-                    article["tags"] = list(set(article["tags"] + ai_tags))[:8]
-
-                if TAG_REQUEST_DELAY_MS > 0:
-                    time.sleep(TAG_REQUEST_DELAY_MS / 1000.0)
-
             new_articles.append(article)
+            batch_urls.add(article["external_url"])
+            batch_keys.add(key)
+
+    resolve_web_thumbnails(new_articles, feed_name)
 
-            url_set.add(article["external_url"])
-            key = f"{article['author']}:{article['title']}"
-            author_title_map[key] = article
+    untagged = [article for article in new_articles if not article["tags"]]
+    for article, ai_tags in zip(untagged, generate_tags_for_articles(untagged)):
+        if ai_tags:
+            article["tags"] = list(set(article["tags"] + ai_tags))[:8]
 
-            print(f"   👉 [{len(new_articles)}] Tagged & Ready: {article['title'][:40]}...")
+    for index, article in enumerate(new_articles, start=1):
+        print(f"   👉 [{index}] Tagged & Ready: {article['title'][:40]}...")
 
     if not new_articles:
         print(f"📝 [{feed_name}] All {duplicate_count} articles are duplicates.")
@@ -141,6 +212,8 @@ def insert_articles(
 
     try:
         inserted_count = repository.insert_articles(new_articles)
+        # 저장에 성공한 글만 인덱스에 반영해야 실패한 글이 다음 실행에서 재시도됩니다.
+        dedup_index.add_many(new_articles)
         print(f"✅ [{feed_name}] Inserted {inserted_count} new articles ({duplicate_count} duplicates)")
         return inserted_count, duplicate_count
     except Exception as e:
@@ -148,32 +221,78 @@ def insert_articles(
         return 0, duplicate_count
 
 
-def run_tech_blog_crawler(repository: TechBlogRepository | None = None):
+def run_tech_blog_crawler(
+    repository: TechBlogRepository | None = None,
+    concurrency: int | None = None,
+    validators: FeedValidatorRepository | None = None,
+    rebuild_index: bool = False,
+):
+    """
+    피드 다운로드는 스레드 풀에서 병렬로 수행하고(전역 동시성 + 호스트별 제한),
+    파싱/중복 제거/저장은 다운로드가 끝나는 순서대로 메인 스레드에서 처리합니다.
+    변경 없는 피드(304)는 파싱/썸네일/태깅/중복 검사를 모두 건너뜁니다.
+    """
     repository = repository or TechBlogRepository()
-    print(f"📊 Starting crawl for {len(RSS_FEEDS)} feeds...")
+    validators = validators or FeedValidatorRepository()
+    concurrency = max(1, concurrency or FEED_FETCH_CONCURRENCY)
+    print(f"📊 Starting crawl for {len(RSS_FEEDS)} feeds (concurrency: {concurrency})...")
 
-    url_set, author_title_map = get_existing_data(repository)
-    print(f"📊 Existing articles: {len(url_set)}")
+    dedup_index = load_dedup_index(repository, rebuild=rebuild_index)
+    print(f"📊 Existing articles: {dedup_index.count()}")
 
     total_new = 0
     total_dup = 0
     total_processed = 0
+    fetched_feeds = 0
+    not_modified_feeds = 0
 
-    for feed in RSS_FEEDS:
-        articles = parse_feed(feed)
-        inserted, duplicates = insert_articles(
-            articles,
-            url_set,
-            author_title_map,
-            feed["name"],
-            repository,
-        )
+    throttle = HostThrottle(
+        max_per_host=FEED_PER_HOST_CONCURRENCY,
+        min_interval_sec=FEED_HOST_DELAY_MS / 1000.0,
+    )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(fetch_feed, feed, throttle, validators): feed for feed in RSS_FEEDS
+        }
 
-        total_new += inserted
-        total_dup += duplicates
-        total_processed += len(articles)
+        for future in as_completed(futures):
+            feed = futures[future]
+            result = future.result()
+            if result is None:
+                continue
+
+            fetched_feeds += 1
+            if result.not_modified:
+                not_modified_feeds += 1
+                continue
+
+            articles = parse_feed_content(feed, result.content)
+            if articles is None:
+                # 파싱에 실패한 피드는 검증자를 저장하지 않아 다음 실행에서 다시 받아옵니다.
+                continue
+
+            inserted, duplicates = insert_articles(
+                articles,
+                dedup_index,
+                feed["name"],
+                repository,
+            )
+
+            total_new += inserted
+            total_dup += duplicates
+            total_processed += len(articles)
+
+            # 항목이 없는 피드도 검증자를 저장해 다음 실행에서 304를 받도록 하고,
+            # DB 저장이 실패하면 검증자를 갱신하지 않아 다음 실행에서 다시 받아옵니다.
+            if inserted + duplicates == len(articles):
+                validators.update(feed["url"], result.etag, result.last_modified)
 
-        time.sleep(1)
+    dedup_index.close()
+    try:
+        validators.save()
+    except Exception as e:
+        print(f"⚠️ Failed to save feed validators: {e}")
 
     print("\n🎉 RSS Crawling Completed!")
     print(f"📊 Total processed: {total_processed}")
@@ -181,3 +300,9 @@ def run_tech_blog_crawler(repository: TechBlogRepository | None = None):
     print(f"🔄 Duplicates found: {total_dup}")
     if total_processed > 0:
         print(f"📈 Deduplication rate: {(total_dup / total_processed * 100):.1f}%")
+    print(f"🏷️ Tag cache: {get_tag_cache().stats_line()}")
+    if fetched_feeds > 0:
+        print(
+            f"🗂️ Conditional GET hits: {not_modified_feeds}/{fetched_feeds} "
+            f"({(not_modified_feeds / fetched_feeds * 100):.1f}%)"
+        )
@@ -0,0 +1,98 @@
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.common.config.settings import TECH_BLOG_DEDUP_DB_PATH
+from src.shared.database import normalize_url
+
+WATERMARK_KEY = "created_at_watermark"
+
+
+def author_title_key(author: str, title: str) -> str:
+    return f"{author}:{title}"
+
+
+class DedupIndex:
+    """
+    blogs 테이블의 정규화 URL / 작성자+제목 키를 보관하는 로컬 SQLite 인덱스입니다.
+    created_at 워터마크 이후의 행만 Supabase에서 가져와 증분 동기화합니다.
+    """
+
+    def __init__(self, db_path: Path = TECH_BLOG_DEDUP_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS author_titles (key TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+            """
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @property
+    def watermark(self) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (WATERMARK_KEY,)).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def sync(self, repository, rebuild: bool = False) -> int:
+        """
+        워터마크가 없거나 rebuild=True이면 전체를 다시 적재하고,
+        그 외에는 워터마크 이후 생성된 행만 반영합니다. 가져온 행 수를 반환합니다.
+        """
+        since = None if rebuild else self.watermark
+        if since is None:
+            rows = repository.fetch_existing_articles()
+            with self._conn:
+                self._conn.execute("DELETE FROM urls")
+                self._conn.execute("DELETE FROM author_titles")
+                self._conn.execute("DELETE FROM meta WHERE key = ?", (WATERMARK_KEY,))
+        else:
+            rows = repository.fetch_articles_created_since(since)
+
+        self.add_many(rows)
+
+        created = [row["created_at"] for row in rows if row.get("created_at")]
+        if created:
+            self._set_watermark(max(created))
+        return len(rows)
+
+    def add_many(self, articles: Iterable[dict[str, Any]]) -> None:
+        urls = []
+        keys = []
+        for article in articles:
+            if article.get("external_url"):
+                urls.append((normalize_url(article["external_url"]),))
+            if article.get("title") and article.get("author"):
+                keys.append((author_title_key(article["author"], article["title"]),))
+
+        with self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO urls (url) VALUES (?)", urls)
+            self._conn.executemany("INSERT OR IGNORE INTO author_titles (key) VALUES (?)", keys)
+
+    def has_url(self, url: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM urls WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def has_author_title(self, author: str, title: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM author_titles WHERE key = ?",
+            (author_title_key(author, title),),
+        ).fetchone()
+        return row is not None
+
+    def _set_watermark(self, value: str) -> None:
+        current = self.watermark
+        if current is not None and current >= value:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (WATERMARK_KEY, value),
+            )
@@ -1,16 +1,66 @@
+from datetime import datetime
 from typing import Any
 
-from src.common.config.settings import BLOGS_TABLE
+from src.common.config.settings import BLOGS_TABLE, FEED_VALIDATORS_PATH
+from src.common.storage.json_repo import JsonFileRepository
 from src.common.storage.supabase_repo import SupabaseTableRepository
 
 
+DEDUP_COLUMNS = "external_url, title, author, published_at, created_at"
+
+
 class TechBlogRepository:
     def __init__(self, table_name: str = BLOGS_TABLE):
         self._repo = SupabaseTableRepository(table_name=table_name)
 
     def fetch_existing_articles(self) -> list[dict[str, Any]]:
-        return self._repo.fetch_all_paged("external_url, title, author, published_at")
+        return self._repo.fetch_all_paged(DEDUP_COLUMNS)
+
+    def fetch_articles_created_since(self, since: str) -> list[dict[str, Any]]:
+        return self._repo.fetch_since(DEDUP_COLUMNS, "created_at", since)
 
     def insert_articles(self, rows: list[dict[str, Any]]) -> int:
         return self._repo.insert_many(rows)
 
+
+class FeedValidatorRepository:
+    """
+    피드 URL별 HTTP 검증자(ETag / Last-Modified)를 보관합니다.
+    다음 실행 시 조건부 GET 헤더로 사용되어, 변경 없는 피드는 304로 건너뜁니다.
+    """
+
+    def __init__(self, file_path=FEED_VALIDATORS_PATH):
+        self._repo = JsonFileRepository(file_path)
+        self._validators = {
+            item["url"]: item
+            for item in self._repo.iter_records()
+            if isinstance(item.get("url"), str)
+        }
+
+    @property
+    def file_path(self):
+        return self._repo.file_path
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        validator = self._validators.get(url) or {}
+        headers = {}
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+        return headers
+
+    def update(self, url: str, etag: str | None, last_modified: str | None) -> None:
+        if not etag and not last_modified:
+            self._validators.pop(url, None)
+            return
+
+        self._validators[url] = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    def save(self) -> None:
+        self._repo.save_list(list(self._validators.values()))
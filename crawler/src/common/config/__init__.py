@@ -1,33 +1,117 @@
 from src.common.config.settings import (
     BLOGS_TABLE,
+    CACHE_DIR,
+    CRAWL_JOURNAL_DIR,
     CRAWLER_ROOT,
     DEV_EVENT_JSON_PATH,
+    EVENT_PROMPT_TOKEN_BUDGET,
+    FEED_FETCH_CONCURRENCY,
+    FEED_HOST_DELAY_MS,
+    FEED_PER_HOST_CONCURRENCY,
+    FEED_VALIDATORS_PATH,
     FIRECRAWL_API_KEY,
+    FIRECRAWL_CACHE_MAX_ENTRIES,
+    FIRECRAWL_CACHE_PATH,
+    FIRECRAWL_CACHE_TTL_DAYS,
+    FIRECRAWL_REQUESTS_PER_MIN,
     GEMINI_API_KEY,
+    GEMINI_REQUESTS_PER_MIN,
+    HTTP_BACKOFF_MS,
+    HTTP_MAX_RETRIES,
+    HTTP_PER_HOST_CONCURRENCY,
+    HTTP_REQUESTS_PER_MIN,
+    HTTP_TIMEOUT_SEC,
+    JOB_PROMPT_TOKEN_BUDGET,
+    JSON_STORAGE_FORMAT,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_DAYS,
+    LLM_RETRY_BASE_MS,
+    LLM_TIMEOUT_SEC,
     PROJECT_ROOT,
     RSS_FEEDS,
+    SARAMIN_DETAIL_MIN_CHARS,
+    SARAMIN_DETAIL_WORKERS,
+    SARAMIN_FIRECRAWL_WORKERS,
+    SARAMIN_GEMINI_WORKERS,
     SARAMIN_JOBS_JSON_PATH,
+    SARAMIN_KEYWORD_CONCURRENCY,
+    SARAMIN_LIST_CONCURRENCY,
+    SARAMIN_REQUESTS_PER_MIN,
+    SARAMIN_SECTION_MIN_CONFIDENCE,
     SUPABASE_KEY,
     SUPABASE_URL,
-    TAG_REQUEST_DELAY_MS,
+    TAG_BATCH_SIZE,
+    TAG_CACHE_MAX_ENTRIES,
+    TAG_CACHE_PATH,
+    TAG_CACHE_TTL_DAYS,
     TAG_RETRY_BASE_MS,
+    TECH_BLOG_DEDUP_DB_PATH,
+    THUMBNAIL_CACHE_PATH,
+    THUMBNAIL_CACHE_TTL_DAYS,
+    THUMBNAIL_CONCURRENCY,
+    THUMBNAIL_HEAD_MAX_BYTES,
+    THUMBNAIL_NEGATIVE_TTL_HOURS,
+    THUMBNAIL_PER_HOST_CONCURRENCY,
     WEB_DATA_DIR,
     settings,
 )
 
 __all__ = [
     "BLOGS_TABLE",
+    "CACHE_DIR",
+    "CRAWL_JOURNAL_DIR",
     "CRAWLER_ROOT",
     "DEV_EVENT_JSON_PATH",
+    "EVENT_PROMPT_TOKEN_BUDGET",
+    "FEED_FETCH_CONCURRENCY",
+    "FEED_HOST_DELAY_MS",
+    "FEED_PER_HOST_CONCURRENCY",
+    "FEED_VALIDATORS_PATH",
     "FIRECRAWL_API_KEY",
+    "FIRECRAWL_CACHE_MAX_ENTRIES",
+    "FIRECRAWL_CACHE_PATH",
+    "FIRECRAWL_CACHE_TTL_DAYS",
+    "FIRECRAWL_REQUESTS_PER_MIN",
     "GEMINI_API_KEY",
+    "GEMINI_REQUESTS_PER_MIN",
+    "HTTP_BACKOFF_MS",
+    "HTTP_MAX_RETRIES",
+    "HTTP_PER_HOST_CONCURRENCY",
+    "HTTP_REQUESTS_PER_MIN",
+    "HTTP_TIMEOUT_SEC",
+    "JOB_PROMPT_TOKEN_BUDGET",
+    "JSON_STORAGE_FORMAT",
+    "LLM_CACHE_MAX_ENTRIES",
+    "LLM_CACHE_PATH",
+    "LLM_CACHE_TTL_DAYS",
+    "LLM_RETRY_BASE_MS",
+    "LLM_TIMEOUT_SEC",
     "PROJECT_ROOT",
     "RSS_FEEDS",
+    "SARAMIN_DETAIL_MIN_CHARS",
+    "SARAMIN_DETAIL_WORKERS",
+    "SARAMIN_FIRECRAWL_WORKERS",
+    "SARAMIN_GEMINI_WORKERS",
     "SARAMIN_JOBS_JSON_PATH",
+    "SARAMIN_KEYWORD_CONCURRENCY",
+    "SARAMIN_LIST_CONCURRENCY",
+    "SARAMIN_REQUESTS_PER_MIN",
+    "SARAMIN_SECTION_MIN_CONFIDENCE",
     "SUPABASE_KEY",
     "SUPABASE_URL",
-    "TAG_REQUEST_DELAY_MS",
+    "TAG_BATCH_SIZE",
+    "TAG_CACHE_MAX_ENTRIES",
+    "TAG_CACHE_PATH",
+    "TAG_CACHE_TTL_DAYS",
     "TAG_RETRY_BASE_MS",
+    "TECH_BLOG_DEDUP_DB_PATH",
+    "THUMBNAIL_CACHE_PATH",
+    "THUMBNAIL_CACHE_TTL_DAYS",
+    "THUMBNAIL_CONCURRENCY",
+    "THUMBNAIL_HEAD_MAX_BYTES",
+    "THUMBNAIL_NEGATIVE_TTL_HOURS",
+    "THUMBNAIL_PER_HOST_CONCURRENCY",
     "WEB_DATA_DIR",
     "settings",
 ]
@@ -43,15 +43,57 @@ class Settings:
     project_root: Path
     crawler_root: Path
     web_data_dir: Path
+    cache_dir: Path
+    feed_validators_path: Path
+    tech_blog_dedup_db_path: Path
+    tag_cache_path: Path
+    thumbnail_cache_path: Path
+    firecrawl_cache_path: Path
+    llm_cache_path: Path
+    crawl_journal_dir: Path
     dev_event_json_path: Path
     saramin_jobs_json_path: Path
     blogs_table: str
+    json_storage_format: str
     supabase_url: str | None
     supabase_key: str | None
     gemini_api_key: str | None
     firecrawl_api_key: str | None
-    tag_request_delay_ms: int
     tag_retry_base_ms: int
+    tag_batch_size: int
+    tag_cache_ttl_days: int
+    tag_cache_max_entries: int
+    llm_timeout_sec: int
+    llm_retry_base_ms: int
+    llm_cache_ttl_days: int
+    llm_cache_max_entries: int
+    job_prompt_token_budget: int
+    event_prompt_token_budget: int
+    http_timeout_sec: int
+    http_max_retries: int
+    http_backoff_ms: int
+    http_per_host_concurrency: int
+    http_requests_per_min: int
+    thumbnail_head_max_bytes: int
+    thumbnail_cache_ttl_days: int
+    thumbnail_concurrency: int
+    thumbnail_per_host_concurrency: int
+    thumbnail_negative_ttl_hours: int
+    feed_fetch_concurrency: int
+    feed_per_host_concurrency: int
+    feed_host_delay_ms: int
+    saramin_list_concurrency: int
+    saramin_keyword_concurrency: int
+    saramin_requests_per_min: int
+    saramin_detail_workers: int
+    saramin_firecrawl_workers: int
+    saramin_gemini_workers: int
+    saramin_detail_min_chars: int
+    saramin_section_min_confidence: int
+    firecrawl_requests_per_min: int
+    firecrawl_cache_ttl_days: int
+    firecrawl_cache_max_entries: int
+    gemini_requests_per_min: int
     rss_feeds: list[dict[str, Any]]
     loaded_env_file: Path | None
 
@@ -66,6 +108,46 @@ def _build_settings() -> Settings:
         project_root / "web" / "public" / "data",
         crawler_root,
     )
+    cache_dir = _resolve_path(
+        os.getenv("CRAWLER_CACHE_DIR"),
+        crawler_root / ".cache",
+        crawler_root,
+    )
+    feed_validators_path = _resolve_path(
+        os.getenv("FEED_VALIDATORS_PATH"),
+        cache_dir / "feed-validators.json",
+        crawler_root,
+    )
+    tech_blog_dedup_db_path = _resolve_path(
+        os.getenv("TECH_BLOG_DEDUP_DB_PATH"),
+        cache_dir / "tech-blog-dedup.sqlite3",
+        crawler_root,
+    )
+    tag_cache_path = _resolve_path(
+        os.getenv("TAG_CACHE_PATH"),
+        cache_dir / "tag-cache.sqlite3",
+        crawler_root,
+    )
+    thumbnail_cache_path = _resolve_path(
+        os.getenv("THUMBNAIL_CACHE_PATH"),
+        cache_dir / "thumbnail-cache.sqlite3",
+        crawler_root,
+    )
+    firecrawl_cache_path = _resolve_path(
+        os.getenv("FIRECRAWL_CACHE_PATH"),
+        cache_dir / "firecrawl-cache.sqlite3",
+        crawler_root,
+    )
+    llm_cache_path = _resolve_path(
+        os.getenv("LLM_CACHE_PATH"),
+        cache_dir / "llm-cache.sqlite3",
+        crawler_root,
+    )
+    crawl_journal_dir = _resolve_path(
+        os.getenv("CRAWL_JOURNAL_DIR"),
+        cache_dir / "journals",
+        crawler_root,
+    )
     dev_event_json_path = _resolve_path(
         os.getenv("DEV_EVENT_JSON_PATH"),
         web_data_dir / "dev-events.json",
@@ -77,19 +159,63 @@ def _build_settings() -> Settings:
         crawler_root,
     )
 
+    tag_retry_base_ms = _safe_int(os.getenv("TAG_RETRY_BASE_MS"), 5000)
+
     return Settings(
         project_root=project_root,
         crawler_root=crawler_root,
         web_data_dir=web_data_dir,
+        cache_dir=cache_dir,
+        feed_validators_path=feed_validators_path,
+        tech_blog_dedup_db_path=tech_blog_dedup_db_path,
+        tag_cache_path=tag_cache_path,
+        thumbnail_cache_path=thumbnail_cache_path,
+        firecrawl_cache_path=firecrawl_cache_path,
+        llm_cache_path=llm_cache_path,
+        crawl_journal_dir=crawl_journal_dir,
         dev_event_json_path=dev_event_json_path,
         saramin_jobs_json_path=saramin_jobs_json_path,
         blogs_table=os.getenv("SUPABASE_BLOGS_TABLE", "blogs"),
+        json_storage_format=os.getenv("JSON_STORAGE_FORMAT", "json").strip().lower(),
         supabase_url=os.getenv("NEXT_PUBLIC_SUPABASE_URL"),
         supabase_key=os.getenv("SUPABASE_SERVICE_ROLE_KEY"),
         gemini_api_key=os.getenv("GEMINI_API_KEY"),
         firecrawl_api_key=os.getenv("FIRECRAWL_API_KEY"),
-        tag_request_delay_ms=_safe_int(os.getenv("TAG_REQUEST_DELAY_MS"), 1000),
-        tag_retry_base_ms=_safe_int(os.getenv("TAG_RETRY_BASE_MS"), 5000),
+        tag_retry_base_ms=tag_retry_base_ms,
+        tag_batch_size=_safe_int(os.getenv("TAG_BATCH_SIZE"), 20),
+        tag_cache_ttl_days=_safe_int(os.getenv("TAG_CACHE_TTL_DAYS"), 90),
+        tag_cache_max_entries=_safe_int(os.getenv("TAG_CACHE_MAX_ENTRIES"), 50000),
+        llm_timeout_sec=_safe_int(os.getenv("LLM_TIMEOUT_SEC"), 120),
+        llm_retry_base_ms=_safe_int(os.getenv("LLM_RETRY_BASE_MS"), tag_retry_base_ms),
+        llm_cache_ttl_days=_safe_int(os.getenv("LLM_CACHE_TTL_DAYS"), 30),
+        llm_cache_max_entries=_safe_int(os.getenv("LLM_CACHE_MAX_ENTRIES"), 5000),
+        job_prompt_token_budget=_safe_int(os.getenv("JOB_PROMPT_TOKEN_BUDGET"), 8000),
+        event_prompt_token_budget=_safe_int(os.getenv("EVENT_PROMPT_TOKEN_BUDGET"), 4000),
+        http_timeout_sec=_safe_int(os.getenv("HTTP_TIMEOUT_SEC"), 20),
+        http_max_retries=_safe_int(os.getenv("HTTP_MAX_RETRIES"), 3),
+        http_backoff_ms=_safe_int(os.getenv("HTTP_BACKOFF_MS"), 1000),
+        http_per_host_concurrency=_safe_int(os.getenv("HTTP_PER_HOST_CONCURRENCY"), 4),
+        http_requests_per_min=_safe_int(os.getenv("HTTP_REQUESTS_PER_MIN"), 120),
+        thumbnail_head_max_bytes=_safe_int(os.getenv("THUMBNAIL_HEAD_MAX_BYTES"), 131072),
+        thumbnail_cache_ttl_days=_safe_int(os.getenv("THUMBNAIL_CACHE_TTL_DAYS"), 30),
+        thumbnail_concurrency=_safe_int(os.getenv("THUMBNAIL_CONCURRENCY"), 8),
+        thumbnail_per_host_concurrency=_safe_int(os.getenv("THUMBNAIL_PER_HOST_CONCURRENCY"), 2),
+        thumbnail_negative_ttl_hours=_safe_int(os.getenv("THUMBNAIL_NEGATIVE_TTL_HOURS"), 24),
+        feed_fetch_concurrency=_safe_int(os.getenv("FEED_FETCH_CONCURRENCY"), 8),
+        feed_per_host_concurrency=_safe_int(os.getenv("FEED_PER_HOST_CONCURRENCY"), 2),
+        feed_host_delay_ms=_safe_int(os.getenv("FEED_HOST_DELAY_MS"), 1000),
+        saramin_list_concurrency=_safe_int(os.getenv("SARAMIN_LIST_CONCURRENCY"), 3),
+        saramin_keyword_concurrency=_safe_int(os.getenv("SARAMIN_KEYWORD_CONCURRENCY"), 3),
+        saramin_requests_per_min=_safe_int(os.getenv("SARAMIN_REQUESTS_PER_MIN"), 30),
+        saramin_detail_workers=_safe_int(os.getenv("SARAMIN_DETAIL_WORKERS"), 3),
+        saramin_firecrawl_workers=_safe_int(os.getenv("SARAMIN_FIRECRAWL_WORKERS"), 2),
+        saramin_gemini_workers=_safe_int(os.getenv("SARAMIN_GEMINI_WORKERS"), 2),
+        saramin_detail_min_chars=_safe_int(os.getenv("SARAMIN_DETAIL_MIN_CHARS"), 300),
+        saramin_section_min_confidence=_safe_int(os.getenv("SARAMIN_SECTION_MIN_CONFIDENCE"), 70),
+        firecrawl_requests_per_min=_safe_int(os.getenv("FIRECRAWL_REQUESTS_PER_MIN"), 10),
+        firecrawl_cache_ttl_days=_safe_int(os.getenv("FIRECRAWL_CACHE_TTL_DAYS"), 7),
+        firecrawl_cache_max_entries=_safe_int(os.getenv("FIRECRAWL_CACHE_MAX_ENTRIES"), 5000),
+        gemini_requests_per_min=_safe_int(os.getenv("GEMINI_REQUESTS_PER_MIN"), 10),
         rss_feeds=[
             {"name": "토스", "url": "https://toss.tech/rss.xml", "type": "company"},
             {"name": "당근", "url": "https://medium.com/feed/daangn", "type": "company"},
@@ -136,15 +262,57 @@ settings = _build_settings()
 PROJECT_ROOT = settings.project_root
 CRAWLER_ROOT = settings.crawler_root
 WEB_DATA_DIR = settings.web_data_dir
+CACHE_DIR = settings.cache_dir
+FEED_VALIDATORS_PATH = settings.feed_validators_path
+TECH_BLOG_DEDUP_DB_PATH = settings.tech_blog_dedup_db_path
 DEV_EVENT_JSON_PATH = settings.dev_event_json_path
 SARAMIN_JOBS_JSON_PATH = settings.saramin_jobs_json_path
 
 BLOGS_TABLE = settings.blogs_table
+JSON_STORAGE_FORMAT = settings.json_storage_format
 SUPABASE_URL = settings.supabase_url
 SUPABASE_KEY = settings.supabase_key
 GEMINI_API_KEY = settings.gemini_api_key
 FIRECRAWL_API_KEY = settings.firecrawl_api_key
-TAG_REQUEST_DELAY_MS = settings.tag_request_delay_ms
 TAG_RETRY_BASE_MS = settings.tag_retry_base_ms
+TAG_BATCH_SIZE = settings.tag_batch_size
+TAG_CACHE_PATH = settings.tag_cache_path
+TAG_CACHE_TTL_DAYS = settings.tag_cache_ttl_days
+TAG_CACHE_MAX_ENTRIES = settings.tag_cache_max_entries
+LLM_TIMEOUT_SEC = settings.llm_timeout_sec
+LLM_RETRY_BASE_MS = settings.llm_retry_base_ms
+LLM_CACHE_PATH = settings.llm_cache_path
+CRAWL_JOURNAL_DIR = settings.crawl_journal_dir
+LLM_CACHE_TTL_DAYS = settings.llm_cache_ttl_days
+LLM_CACHE_MAX_ENTRIES = settings.llm_cache_max_entries
+JOB_PROMPT_TOKEN_BUDGET = settings.job_prompt_token_budget
+EVENT_PROMPT_TOKEN_BUDGET = settings.event_prompt_token_budget
+HTTP_TIMEOUT_SEC = settings.http_timeout_sec
+HTTP_MAX_RETRIES = settings.http_max_retries
+HTTP_BACKOFF_MS = settings.http_backoff_ms
+HTTP_PER_HOST_CONCURRENCY = settings.http_per_host_concurrency
+HTTP_REQUESTS_PER_MIN = settings.http_requests_per_min
+THUMBNAIL_HEAD_MAX_BYTES = settings.thumbnail_head_max_bytes
+THUMBNAIL_CACHE_PATH = settings.thumbnail_cache_path
+THUMBNAIL_CACHE_TTL_DAYS = settings.thumbnail_cache_ttl_days
+THUMBNAIL_CONCURRENCY = settings.thumbnail_concurrency
+THUMBNAIL_PER_HOST_CONCURRENCY = settings.thumbnail_per_host_concurrency
+THUMBNAIL_NEGATIVE_TTL_HOURS = settings.thumbnail_negative_ttl_hours
+FEED_FETCH_CONCURRENCY = settings.feed_fetch_concurrency
+FEED_PER_HOST_CONCURRENCY = settings.feed_per_host_concurrency
+FEED_HOST_DELAY_MS = settings.feed_host_delay_ms
+SARAMIN_LIST_CONCURRENCY = settings.saramin_list_concurrency
+SARAMIN_KEYWORD_CONCURRENCY = settings.saramin_keyword_concurrency
+SARAMIN_REQUESTS_PER_MIN = settings.saramin_requests_per_min
+SARAMIN_DETAIL_WORKERS = settings.saramin_detail_workers
+SARAMIN_FIRECRAWL_WORKERS = settings.saramin_firecrawl_workers
+SARAMIN_GEMINI_WORKERS = settings.saramin_gemini_workers
+SARAMIN_DETAIL_MIN_CHARS = settings.saramin_detail_min_chars
+SARAMIN_SECTION_MIN_CONFIDENCE = settings.saramin_section_min_confidence
+FIRECRAWL_REQUESTS_PER_MIN = settings.firecrawl_requests_per_min
+FIRECRAWL_CACHE_PATH = settings.firecrawl_cache_path
+FIRECRAWL_CACHE_TTL_DAYS = settings.firecrawl_cache_ttl_days
+FIRECRAWL_CACHE_MAX_ENTRIES = settings.firecrawl_cache_max_entries
+GEMINI_REQUESTS_PER_MIN = settings.gemini_requests_per_min
 RSS_FEEDS = settings.rss_feeds
 
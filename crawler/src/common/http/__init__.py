@@ -0,0 +1,12 @@
+from src.common.http.client import DEFAULT_USER_AGENT, HttpClient, get_http_client
+from src.common.http.rate_limit import TokenBucket, get_rate_limiter
+from src.common.http.throttle import HostThrottle
+
+__all__ = [
+    "DEFAULT_USER_AGENT",
+    "HostThrottle",
+    "HttpClient",
+    "TokenBucket",
+    "get_http_client",
+    "get_rate_limiter",
+]
@@ -0,0 +1,138 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.common.config.settings import (
+    HTTP_BACKOFF_MS,
+    HTTP_MAX_RETRIES,
+    HTTP_PER_HOST_CONCURRENCY,
+    HTTP_TIMEOUT_SEC,
+)
+from src.common.http.rate_limit import TokenBucket
+from src.common.http.throttle import HostThrottle
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class HttpClient:
+    """
+    모든 크롤러가 공유하는 HTTP 클라이언트입니다.
+    keep-alive 커넥션 풀을 재사용하고, 기본 타임아웃/공통 User-Agent를 적용하며,
+    5xx/429 응답은 Retry-After를 존중하며 지수 백오프로 재시도합니다.
+    rate_limiter(토큰 버킷)를 쓰는 요청은 상태 코드 재시도를 urllib3에 맡기지 않고 직접 반복해,
+    재시도마다 토큰을 얻고 429/5xx 응답마다 버킷이 감속하도록 합니다.
+    요청은 호스트별 동시성 제한(HostThrottle) 안에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: float = HTTP_TIMEOUT_SEC,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_sec: float = HTTP_BACKOFF_MS / 1000.0,
+        max_per_host: int = HTTP_PER_HOST_CONCURRENCY,
+        pool_maxsize: int = 32,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.throttle = HostThrottle(max_per_host=max_per_host)
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_sec,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # 토큰 버킷용 세션은 연결/읽기 오류만 urllib3가 재시도하고, 429/5xx는 그대로 돌려받습니다.
+        connection_retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=0,
+            backoff_factor=backoff_sec,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+
+        self.session = self._build_session(user_agent, retry, pool_maxsize)
+        self.limited_session = self._build_session(user_agent, connection_retry, pool_maxsize)
+
+    @staticmethod
+    def _build_session(user_agent: str, retry: Retry, pool_maxsize: int) -> requests.Session:
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=pool_maxsize)
+        session = requests.Session()
+        session.headers.update({"User-Agent": user_agent})
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        throttle: HostThrottle | None = None,
+        rate_limiter: TokenBucket | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        throttle을 지정하면 클라이언트 기본 호스트 제한 대신 해당 제한을 사용합니다.
+        rate_limiter를 지정하면 시도마다 토큰을 얻고, 429/5xx 응답마다 Retry-After를 반영해 감속한 뒤
+        (GET/HEAD는) max_retries번까지 다시 시도합니다. 재시도 간격은 감속된 버킷이 정합니다.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if rate_limiter is None:
+            with (throttle or self.throttle).slot(url):
+                return self.session.request(method, url, **kwargs)
+
+        attempts = self.max_retries + 1 if method.upper() in RETRY_METHODS else 1
+        for attempt in range(attempts):
+            rate_limiter.acquire()
+            with (throttle or self.throttle).slot(url):
+                response = self.limited_session.request(method, url, **kwargs)
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                rate_limiter.on_success()
+                return response
+
+            rate_limiter.on_throttle(retry_after_seconds(response))
+            if attempt + 1 < attempts:
+                response.close()
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: HttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+
+from src.common.config.settings import (
+    FIRECRAWL_REQUESTS_PER_MIN,
+    GEMINI_REQUESTS_PER_MIN,
+    HTTP_REQUESTS_PER_MIN,
+    SARAMIN_LIST_CONCURRENCY,
+    SARAMIN_REQUESTS_PER_MIN,
+)
+
+# 서비스별 (분당 요청 수, burst). "gemini:<모델명>"처럼 ':' 뒤가 붙은 이름은 앞부분 설정을 따르며,
+# 목록에 없는 서비스(일반 호스트 등)는 HTTP_REQUESTS_PER_MIN을 사용합니다.
+SERVICE_RATE_LIMITS = {
+    "gemini": (GEMINI_REQUESTS_PER_MIN, 1),
+    "firecrawl": (FIRECRAWL_REQUESTS_PER_MIN, 1),
+    "saramin": (SARAMIN_REQUESTS_PER_MIN, SARAMIN_LIST_CONCURRENCY),
+}
+
+
+class TokenBucket:
+    """
+    분당 요청 수(rate_per_min)만큼 토큰을 채우는 토큰 버킷입니다. burst개까지는 연달아 보낼 수 있습니다.
+    429/5xx/quota 오류를 만나면 on_throttle()로 속도를 절반으로 낮추고(최저 min_rate_per_min),
+    성공할 때마다 on_success()로 원래 속도의 recovery_step 비율만큼 천천히 회복합니다.
+    스레드에서는 acquire(), asyncio 코드에서는 acquire_async()로 같은 버킷을 공유할 수 있습니다.
+    HttpClient.request(rate_limiter=...)는 재시도를 포함한 모든 시도마다 acquire()와 on_success()/on_throttle()을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_min: float,
+        burst: int = 1,
+        min_rate_per_min: float | None = None,
+        recovery_step: float = 0.1,
+    ):
+        self.max_rate = max(rate_per_min, 1e-3) / 60.0
+        self.min_rate = min(self.max_rate, (min_rate_per_min or rate_per_min / 8) / 60.0)
+        self.rate = self.max_rate
+        self.capacity = max(1, burst)
+        self.recovery_step = recovery_step
+        self.throttled = 0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate_per_min(self) -> float:
+        return self.rate * 60.0
+
+    def acquire(self) -> None:
+        while True:
+            wait = self._try_take()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        while True:
+            wait = self._try_take()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_step)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """retry_after(초)가 주어지면 그 시간 동안은 어떤 요청도 토큰을 얻지 못합니다."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            # 쌓아 둔 burst도 버려서 바로 다음 요청부터 느려지도록 합니다.
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._tokens = min(self._tokens, 1 - retry_after * self.rate)
+            self.throttled += 1
+
+    def _try_take(self) -> float:
+        """토큰을 얻으면 0을, 아니면 다음 토큰까지 기다려야 할 시간(초)을 반환합니다."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(service: str) -> TokenBucket:
+    """서비스 이름별로 프로세스 전체에서 공유하는 토큰 버킷을 반환합니다."""
+    with _limiters_lock:
+        limiter = _limiters.get(service)
+        if limiter is None:
+            rate_per_min, burst = SERVICE_RATE_LIMITS.get(
+                service.split(":", 1)[0],
+                (HTTP_REQUESTS_PER_MIN, 1),
+            )
+            limiter = TokenBucket(rate_per_min, burst=burst)
+            _limiters[service] = limiter
+        return limiter
@@ -0,0 +1,50 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class HostThrottle:
+    """
+    호스트별 동시 요청 수를 제한하고, 같은 호스트에 대한 요청 시작 간격을 보장합니다.
+    (예: medium.com 피드 여러 개가 하나의 호스트 예산을 공유)
+    """
+
+    def __init__(self, max_per_host: int = 2, min_interval_sec: float = 0.0):
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval_sec = max(0.0, min_interval_sec)
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    @contextmanager
+    def slot(self, url: str):
+        host = self.host_of(url)
+        with self._semaphore_for(host):
+            self._wait_turn(host)
+            yield
+
+    def _semaphore_for(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    def _wait_turn(self, host: str) -> None:
+        if self.min_interval_sec <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start_at + self.min_interval_sec
+
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
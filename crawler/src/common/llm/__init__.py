@@ -0,0 +1,21 @@
+from src.common.llm.cache import LLMResponseCache
+from src.common.llm.gemini import (
+    GeminiClient,
+    LLMError,
+    LLMModelNotFoundError,
+    LLMQuotaError,
+    LLMUnavailableError,
+    get_gemini_client,
+    is_quota_error,
+)
+
+__all__ = [
+    "GeminiClient",
+    "LLMError",
+    "LLMModelNotFoundError",
+    "LLMQuotaError",
+    "LLMResponseCache",
+    "LLMUnavailableError",
+    "get_gemini_client",
+    "is_quota_error",
+]
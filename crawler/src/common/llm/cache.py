@@ -0,0 +1,73 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable
+
+from loguru import logger
+
+from src.common.config.settings import LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PATH, LLM_CACHE_TTL_DAYS
+from src.common.storage.cache_repo import SqliteCacheRepository
+
+
+class LLMResponseCache:
+    """
+    구조화(JSON) LLM 응답을 (모델, 프롬프트 템플릿 버전, 입력 해시) 키로 보관하는 영속 캐시입니다.
+    validator를 통과한 응답만 저장하고, 읽을 때도 다시 검증해 형식이 맞지 않는 항목은 미스로 처리합니다.
+    프롬프트 템플릿을 바꾸면 prompt_version을 올려 이전 응답이 재사용되지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        prompt_version: str,
+        validator: Callable[[Any], bool] | None = None,
+        repository: SqliteCacheRepository | None = None,
+    ):
+        self.namespace = namespace
+        self.prompt_version = prompt_version
+        self.validator = validator
+        self._repository = repository
+        self._lock = threading.Lock()
+
+    @property
+    def repository(self) -> SqliteCacheRepository:
+        with self._lock:
+            if self._repository is None:
+                self._repository = SqliteCacheRepository(
+                    LLM_CACHE_PATH,
+                    namespace=self.namespace,
+                    ttl_seconds=LLM_CACHE_TTL_DAYS * 86400,
+                    max_entries=LLM_CACHE_MAX_ENTRIES,
+                )
+            return self._repository
+
+    def key(self, model_name: str, *inputs: str) -> str:
+        content_hash = hashlib.sha256(json.dumps(inputs, ensure_ascii=False).encode("utf-8")).hexdigest()
+        payload = json.dumps([model_name, self.prompt_version, content_hash])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        try:
+            value = self.repository.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache lookup failed: {e}")
+            return None
+        if value is not None and not self._is_valid(value):
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        if not self._is_valid(value):
+            return False
+        try:
+            self.repository.set(key, value)
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache write failed: {e}")
+            return False
+        return True
+
+    def stats_line(self) -> str:
+        return self.repository.stats_line()
+
+    def _is_valid(self, value: Any) -> bool:
+        return self.validator(value) if self.validator else value is not None
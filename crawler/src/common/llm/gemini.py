@@ -0,0 +1,164 @@
+import json
+import threading
+import time
+from typing import Any
+
+import google.generativeai as genai
+from loguru import logger
+
+from src.common.config.settings import GEMINI_API_KEY, LLM_RETRY_BASE_MS, LLM_TIMEOUT_SEC
+from src.common.http.rate_limit import get_rate_limiter
+
+
+class LLMError(Exception):
+    """Gemini 호출이 최종적으로 실패했을 때 발생합니다."""
+
+
+class LLMUnavailableError(LLMError):
+    """API 키가 없어 호출할 수 없을 때 발생합니다."""
+
+
+class LLMQuotaError(LLMError):
+    """429 / quota 초과로 재시도를 모두 소진했을 때 발생합니다."""
+
+
+class LLMModelNotFoundError(LLMError):
+    """요청한 모델을 찾을 수 없을 때 발생합니다."""
+
+
+def is_quota_error(error: Exception) -> bool:
+    message = str(error)
+    return "429" in message or "quota" in message.lower()
+
+
+def is_model_not_found_error(error: Exception) -> bool:
+    message = str(error)
+    return "404" in message and "not found" in message.lower()
+
+
+def parse_json_text(text: str) -> Any:
+    cleaned = (text or "").strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.replace("```json", "").replace("```", "").strip()
+    return json.loads(cleaned)
+
+
+class GeminiClient:
+    """
+    프로세스 전체에서 공유하는 Gemini 클라이언트입니다.
+    genai.configure는 한 번만 호출하고, 모델 핸들은 (모델명, 안전 설정)별로 캐시합니다.
+    재시도/타임아웃/JSON 모드 처리를 한 곳에서 담당하므로 태거와 각 프로세서가 같은 상태를 공유합니다.
+    모든 호출은 모델별 토큰 버킷(GEMINI_REQUESTS_PER_MIN)을 거치며, quota 오류는 버킷을 감속시켜
+    같은 모델을 쓰는 다른 스레드도 함께 물러나도록 합니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = GEMINI_API_KEY,
+        timeout_sec: float = LLM_TIMEOUT_SEC,
+        retry_base_sec: float = LLM_RETRY_BASE_MS / 1000.0,
+    ):
+        self.api_key = api_key
+        self.timeout_sec = timeout_sec
+        self.retry_base_sec = retry_base_sec
+        self._lock = threading.Lock()
+        self._configured = False
+        self._models: dict[tuple[str, Any], genai.GenerativeModel] = {}
+
+    @property
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def model(self, model_name: str, safety_settings: dict | None = None) -> genai.GenerativeModel:
+        if not self.api_key:
+            raise LLMUnavailableError("GEMINI_API_KEY is missing.")
+
+        key = (model_name, tuple(sorted(safety_settings.items())) if safety_settings else None)
+        with self._lock:
+            if not self._configured:
+                genai.configure(api_key=self.api_key)
+                self._configured = True
+
+            model = self._models.get(key)
+            if model is None:
+                model = genai.GenerativeModel(model_name, safety_settings=safety_settings)
+                self._models[key] = model
+            return model
+
+    def generate_text(
+        self,
+        prompt: str,
+        model_name: str,
+        json_mode: bool = False,
+        max_retries: int = 3,
+        safety_settings: dict | None = None,
+    ) -> str:
+        return self._call(prompt, model_name, json_mode, max_retries, safety_settings, parse=False)
+
+    def generate_json(
+        self,
+        prompt: str,
+        model_name: str,
+        max_retries: int = 3,
+        safety_settings: dict | None = None,
+    ) -> Any:
+        """JSON 모드로 호출하고 파싱된 결과를 반환합니다. 파싱 실패도 재시도 대상입니다."""
+        return self._call(prompt, model_name, True, max_retries, safety_settings, parse=True)
+
+    def _call(
+        self,
+        prompt: str,
+        model_name: str,
+        json_mode: bool,
+        max_retries: int,
+        safety_settings: dict | None,
+        parse: bool,
+    ) -> Any:
+        model = self.model(model_name, safety_settings)
+        limiter = get_rate_limiter(f"gemini:{model_name}")
+        generation_config = {"response_mime_type": "application/json"} if json_mode else None
+        attempts = max(1, max_retries)
+
+        for attempt in range(attempts):
+            limiter.acquire()
+            try:
+                response = model.generate_content(
+                    prompt,
+                    generation_config=generation_config,
+                    request_options={"timeout": self.timeout_sec},
+                )
+                limiter.on_success()
+                return parse_json_text(response.text) if parse else response.text
+            except Exception as e:
+                if is_model_not_found_error(e):
+                    raise LLMModelNotFoundError(str(e)) from e
+
+                last_attempt = attempt + 1 >= attempts
+                if is_quota_error(e):
+                    wait_time = (2 ** attempt) * self.retry_base_sec
+                    # 대기는 버킷이 담당하므로 다음 acquire()에서 이 호출과 다른 호출 모두 기다리게 됩니다.
+                    limiter.on_throttle(retry_after=wait_time)
+                    if last_attempt:
+                        raise LLMQuotaError(str(e)) from e
+                    logger.warning(
+                        f"⏳ Gemini rate limit hit. Retrying in {wait_time}s... (Attempt {attempt + 1}/{attempts})"
+                    )
+                else:
+                    if last_attempt:
+                        raise LLMError(str(e)) from e
+                    logger.warning(f"⚠️ Gemini attempt {attempt + 1}/{attempts} failed: {e}")
+                    time.sleep(self.retry_base_sec)
+
+        raise LLMError("Gemini call failed.")
+
+
+_client: GeminiClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_gemini_client() -> GeminiClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GeminiClient()
+        return _client
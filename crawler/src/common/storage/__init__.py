@@ -1,5 +1,7 @@
+from src.common.storage.cache_repo import SqliteCacheRepository
+from src.common.storage.journal import RunJournal
 from src.common.storage.json_repo import JsonFileRepository
 from src.common.storage.supabase_repo import SupabaseTableRepository
 
-__all__ = ["JsonFileRepository", "SupabaseTableRepository"]
+__all__ = ["JsonFileRepository", "RunJournal", "SqliteCacheRepository", "SupabaseTableRepository"]
 
@@ -0,0 +1,143 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+
+class SqliteCacheRepository:
+    """
+    SQLite 기반의 영속 키-값 캐시입니다. 값은 JSON으로 직렬화(선택적으로 zlib 압축)되며,
+    항목별 TTL과 최대 항목 수(가장 오래 사용되지 않은 항목부터 제거)를 지원합니다.
+    여러 캐시가 namespace로 구분되어 같은 파일을 공유할 수 있고, 스레드 간 공유가 가능합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        namespace: str = "default",
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        compress: bool = False,
+    ):
+        self.db_path = Path(db_path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.compress = compress
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed
+                ON cache_entries (namespace, accessed_at);
+            """
+        )
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    )
+                self.misses += 1
+                return None
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+            self.hits += 1
+
+        return self._decode(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, self._encode(value), expires_at, now),
+            )
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats_line(self) -> str:
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return f"{self.hits} hits / {self.misses} misses ({rate:.1f}%)"
+
+    def _evict(self) -> None:
+        self._conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+            (self.namespace, time.time()),
+        )
+        if not self.max_entries:
+            return
+
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                "SELECT key FROM cache_entries WHERE namespace = ? ORDER BY accessed_at LIMIT ?)",
+                (self.namespace, self.namespace, overflow),
+            )
+
+    def _encode(self, value: Any) -> bytes:
+        raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        return zlib.compress(raw) if self.compress else raw
+
+    def _decode(self, blob: bytes) -> Any:
+        raw = zlib.decompress(blob) if self.compress else blob
+        return json.loads(raw.decode("utf-8"))
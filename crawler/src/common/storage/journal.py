@@ -0,0 +1,71 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+class RunJournal:
+    """
+    크롤러 실행 중 완료된 항목을 한 줄씩 기록하는 추가 전용(JSONL) 저널입니다.
+    항목마다 바로 flush/fsync하므로 실행이 중간에 끊겨도 그때까지 끝난 항목은 남고,
+    다음 실행에서 load()로 불러와 Firecrawl/Gemini 작업을 반복하지 않고 재사용할 수 있습니다.
+    실행이 정상적으로 끝나 결과를 저장하면 discard()로 지웁니다.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, Any]:
+        """기록된 항목을 key 기준으로 반환합니다. 같은 key는 나중 기록이 우선하고, 잘린 마지막 줄은 무시합니다."""
+        if not self.file_path.exists():
+            return {}
+
+        records: dict[str, Any] = {}
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    records[entry["key"]] = entry["record"]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"⚠️ Skipping unreadable journal line {line_number} in {self.file_path}")
+        return records
+
+    def append(self, key: str, record: Any) -> None:
+        line = json.dumps({"key": key, "record": record}, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                needs_newline = self._ends_without_newline()
+                self._file = open(self.file_path, "a", encoding="utf-8")
+                if needs_newline:
+                    # 이전 실행이 줄 중간에 끊겼다면 새 기록이 그 줄에 붙지 않도록 줄을 바꿉니다.
+                    self._file.write("\n")
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def discard(self) -> None:
+        """저널 파일을 지웁니다. 새 실행을 시작하거나 실행 결과를 저장한 뒤 호출합니다."""
+        self.close()
+        with self._lock:
+            self.file_path.unlink(missing_ok=True)
+
+    def _ends_without_newline(self) -> bool:
+        if not self.file_path.exists() or self.file_path.stat().st_size == 0:
+            return False
+        with open(self.file_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
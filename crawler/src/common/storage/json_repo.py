@@ -1,28 +1,111 @@
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from src.common.config.settings import JSON_STORAGE_FORMAT
+
+
+@contextmanager
+def atomic_write(file_path: Path):
+    """
+    같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 교체합니다.
+    읽는 쪽(Next.js 등)은 항상 이전 파일 전체 또는 새 파일 전체만 보게 되고, 쓰기 중 실패하면 기존 파일이 유지됩니다.
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp는 0600으로 만들므로, 웹 서버가 계속 읽을 수 있도록 기존 파일 권한(없으면 0644)을 유지합니다.
+    mode = file_path.stat().st_mode & 0o777 if file_path.exists() else 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{file_path.name}.", suffix=".tmp", dir=file_path.parent)
+    try:
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_json_array(f, records: Iterable[dict[str, Any]]) -> None:
+    """json.dump(list, indent=2)와 같은 모양의 배열을 항목 단위로 씁니다. 전체 목록을 메모리에 둘 필요가 없습니다."""
+    first = True
+    for record in records:
+        f.write("[\n" if first else ",\n")
+        item = json.dumps(record, ensure_ascii=False, indent=2)
+        f.write("  " + item.replace("\n", "\n  "))
+        first = False
+    f.write("[]" if first else "\n]")
+
+
+def jsonl_companion(file_path: Path) -> Path | None:
+    """JSON_STORAGE_FORMAT=jsonl이면 JSON 배열 파일 옆의 JSONL 원본 경로를, 아니면 None을 반환합니다."""
+    return Path(file_path).with_suffix(".jsonl") if JSON_STORAGE_FORMAT == "jsonl" else None
 
 
 class JsonFileRepository:
-    def __init__(self, file_path: Path):
+    """
+    dict 목록을 JSON 배열 파일로 저장합니다. 모든 쓰기는 임시 파일 + rename으로 원자적으로 교체됩니다.
+    jsonl_path가 주어지면 한 줄에 한 항목인 JSONL 파일을 원본으로 쓰고(항목 단위 스트리밍 읽기/쓰기),
+    file_path의 JSON 배열은 웹 앱용 내보내기로 save_list/export_json 때 함께 갱신합니다.
+    """
+
+    def __init__(self, file_path: Path, jsonl_path: Path | None = None):
         self.file_path = Path(file_path)
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """
+        저장된 항목을 하나씩 반환합니다. JSONL 파일이 있으면 한 줄씩 읽어 항목당 메모리만 사용하고,
+        없으면(JSONL로 전환하기 전의 데이터) JSON 배열 파일을 읽습니다.
+        """
+        if self.jsonl_path and self.jsonl_path.exists():
+            with open(self.jsonl_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        # 손상된 줄은 건너뜁니다.
+                        continue
+                    if isinstance(item, dict):
+                        yield item
+            return
 
-    def load_list(self) -> list[dict[str, Any]]:
         if not self.file_path.exists():
-            return []
+            return
 
         try:
             with open(self.file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
         except Exception:
-            return []
+            return
 
         if isinstance(data, list):
-            return [item for item in data if isinstance(item, dict)]
-        return []
+            yield from (item for item in data if isinstance(item, dict))
+
+    def load_list(self) -> list[dict[str, Any]]:
+        return list(self.iter_records())
+
+    def save_list(self, data: Iterable[dict[str, Any]]) -> None:
+        if self.jsonl_path is None:
+            with atomic_write(self.file_path) as f:
+                write_json_array(f, data)
+            return
 
-    def save_list(self, data: list[dict[str, Any]]) -> None:
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with atomic_write(self.jsonl_path) as f:
+            for record in data:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.export_json()
 
+    def export_json(self) -> None:
+        """JSONL 원본을 한 줄씩 읽어 웹 앱용 JSON 배열 파일을 원자적으로 다시 씁니다."""
+        if self.jsonl_path is None:
+            return
+        with atomic_write(self.file_path) as f:
+            write_json_array(f, self.iter_records())
@@ -40,6 +40,39 @@ class SupabaseTableRepository:
 
         return all_rows
 
+    def fetch_since(
+        self,
+        columns: str,
+        column: str,
+        since: str,
+        page_size: int = 1000,
+    ) -> list[dict[str, Any]]:
+        """column 값이 since 이상인 행만 column 오름차순으로 페이지 단위 조회합니다."""
+        all_rows: list[dict[str, Any]] = []
+        offset = 0
+
+        while True:
+            response = (
+                self.client.table(self.table_name)
+                .select(columns)
+                .gte(column, since)
+                .order(column)
+                .range(offset, offset + page_size - 1)
+                .execute()
+            )
+            rows = response.data or []
+
+            if not rows:
+                break
+
+            all_rows.extend(rows)
+            if len(rows) < page_size:
+                break
+
+            offset += page_size
+
+        return all_rows
+
     def insert_many(self, rows: list[dict[str, Any]]) -> int:
         if not rows:
             return 0
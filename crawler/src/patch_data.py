@@ -1,11 +1,12 @@
 import re
 
 from src.common.config.settings import DEV_EVENT_JSON_PATH
-from src.common.storage.json_repo import JsonFileRepository
+from src.common.storage.json_repo import JsonFileRepository, jsonl_companion
 
 
 def patch_data():
-    repo = JsonFileRepository(DEV_EVENT_JSON_PATH)
+    # JSONL 모드에서는 원본(.jsonl)을 고쳐야 다음 크롤링의 내보내기에서 수정 내용이 유지됩니다.
+    repo = JsonFileRepository(DEV_EVENT_JSON_PATH, jsonl_path=jsonl_companion(DEV_EVENT_JSON_PATH))
     data = repo.load_list()
 
     if not data:
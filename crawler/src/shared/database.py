@@ -1,9 +1,37 @@
 import re
-import requests
+import threading
+from dataclasses import dataclass
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import time
 
+from src.common.config.settings import (
+    THUMBNAIL_CACHE_PATH,
+    THUMBNAIL_CACHE_TTL_DAYS,
+    THUMBNAIL_HEAD_MAX_BYTES,
+    THUMBNAIL_NEGATIVE_TTL_HOURS,
+)
+from src.common.http import get_http_client
+from src.common.storage.cache_repo import SqliteCacheRepository
+
+HEAD_END_MARKER = b"</head>"
+SUMMARY_MAX_LENGTH = 200
+NON_VISIBLE_TAGS = {"script", "style", "template"}
+PRESERVE_WHITESPACE_TAGS = {"pre", "textarea"}
+ASCII_SPACES = " \n\t\x0c\r"
+
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
+
+def get_thumbnail_cache():
+    global _thumbnail_cache
+    # resolve_web_thumbnails의 스레드들이 동시에 처음 호출해도 캐시(SQLite 연결)는 하나만 만듭니다.
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            _thumbnail_cache = SqliteCacheRepository(THUMBNAIL_CACHE_PATH, namespace="thumbnails")
+        return _thumbnail_cache
+
 def strip_html(html_content):
     if not html_content:
         return ""
@@ -52,67 +80,250 @@ def create_summary(content, feed_config=None, entry=None):
         # For python, just use simple strip_html and truncate
         pass
 
-    cleaned = strip_html(content)
-    if len(cleaned) > 200:
-        return cleaned[:200] + "..."
+    root = parse_html_document(content)
+    if root is None:
+        return ""
+    return summarize_visible_text(root)
+
+def truncate_summary(cleaned, max_length=SUMMARY_MAX_LENGTH):
+    if len(cleaned) > max_length:
+        return cleaned[:max_length] + "..."
     return cleaned
 
-def fetch_thumbnail_from_web(url, blog_name="Web"):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code != 200:
-            # Common anti-bot codes
-            if response.status_code in [403, 401, 429]:
-                 print(f"⚠️ [{blog_name} Thumbnail] Access Denied ({response.status_code}): {url}")
-            else:
-                 print(f"⚠️ [{blog_name} Thumbnail] Fetch failed ({response.status_code}): {url}")
+def iter_visible_text(root):
+    """
+    BeautifulSoup(lxml).get_text()와 같은 규칙으로 문서 순서의 텍스트 조각을 돌려줍니다.
+    주석과 script/style/template 내부 텍스트는 제외하고, ASCII 공백만 있는 조각은
+    (pre/textarea 밖이라면) 줄바꿈 포함 시 "\n", 아니면 " "로 축약합니다.
+    """
+    skip_depth = 0
+    preserve_depth = 0
+
+    def normalize(text):
+        if not text:
             return None
+        if preserve_depth == 0 and not text.strip(ASCII_SPACES):
+            return "\n" if "\n" in text else " "
+        return text
 
-        soup = BeautifulSoup(response.content, "lxml")
+    for event, element in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        tag = element.tag if isinstance(element.tag, str) else None
+
+        if event in ("comment", "pi"):
+            tail = normalize(element.tail) if skip_depth == 0 else None
+            if tail:
+                yield tail
+            continue
+
+        if event == "start":
+            if tag in NON_VISIBLE_TAGS:
+                skip_depth += 1
+            if tag in PRESERVE_WHITESPACE_TAGS:
+                preserve_depth += 1
+            if tag is not None and skip_depth == 0:
+                text = normalize(element.text)
+                if text:
+                    yield text
+            continue
+
+        if tag in NON_VISIBLE_TAGS:
+            skip_depth -= 1
+        if tag in PRESERVE_WHITESPACE_TAGS:
+            preserve_depth -= 1
+        if element is not root and skip_depth == 0:
+            tail = normalize(element.tail)
+            if tail:
+                yield tail
+
+def summarize_visible_text(root, max_length=SUMMARY_MAX_LENGTH):
+    """
+    truncate_summary(get_text 결과)와 같은 요약을 만들되, 앞에서부터 max_length자를 채운 뒤
+    뒤에 보이는 텍스트가 더 있는지만 확인되면 나머지 DOM은 순회하지 않고 멈춥니다.
+    """
+    parts = []
+    length = 0
+    for piece in iter_visible_text(root):
+        if length == 0:
+            # 앞쪽 공백은 어차피 strip되므로 버립니다.
+            piece = piece.lstrip()
+            if not piece:
+                continue
+        else:
+            piece = " " + piece
+
+        if length > max_length:
+            # 요약은 이미 정해졌고, 공백이 아닌 텍스트가 더 있으면 말줄임표를 붙입니다.
+            if piece.strip():
+                return "".join(parts)[:max_length] + "..."
+            continue
+
+        parts.append(piece)
+        length += len(piece)
+        if length > max_length:
+            text = "".join(parts)
+            if text[max_length:].strip():
+                return text[:max_length] + "..."
+            parts = [text]
+
+    return truncate_summary("".join(parts).rstrip(), max_length)
+
+@dataclass
+class EntryContent:
+    summary: str
+    image: str | None
+    text_length: int | None
+
+def parse_html_document(html_content):
+    if not html_content or not html_content.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return None
+
+def process_entry_html(html_content, link="", measure_length=False):
+    """
+    피드 항목 본문 HTML을 lxml로 한 번만 파싱해 요약, 첫 번째 사용 가능한 이미지, 본문 텍스트 길이를 함께 구합니다.
+    요약은 create_summary, 이미지는 extract_thumbnail의 본문 이미지 규칙과 같은 결과를 냅니다.
+    전체 텍스트 길이는 본문 전체를 순회해야 하므로 measure_length=True일 때만 계산하고, 아니면 None입니다.
+    """
+    root = parse_html_document(html_content)
+    if root is None:
+        return EntryContent(summary="", image=None, text_length=0)
+
+    if measure_length:
+        cleaned = " ".join(iter_visible_text(root)).strip()
+        summary, text_length = truncate_summary(cleaned), len(cleaned)
+    else:
+        summary, text_length = summarize_visible_text(root), None
+
+    image = None
+    for img in root.iter("img"):
+        image = usable_image_src(img.get("src") or img.get("data-src"), link)
+        if image:
+            break
+
+    return EntryContent(summary=summary, image=image, text_length=text_length)
+
+def read_html_head(response, max_bytes=THUMBNAIL_HEAD_MAX_BYTES):
+    """
+    스트리밍 응답을 조금씩 읽다가 </head>를 만나거나 max_bytes에 도달하면 멈추고 그때까지의 바이트를 반환합니다.
+    """
+    buffer = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        if not chunk:
+            continue
+        search_from = max(0, len(buffer) - len(HEAD_END_MARKER))
+        buffer.extend(chunk)
+        end = buffer[search_from:].lower().find(HEAD_END_MARKER)
+        if end != -1:
+            return bytes(buffer[:search_from + end + len(HEAD_END_MARKER)])
+        if len(buffer) >= max_bytes:
+            break
+    return bytes(buffer[:max_bytes])
+
+def find_meta_content(head_html, attr, value):
+    try:
+        root = lxml_html.document_fromstring(head_html)
+    except (etree.ParserError, ValueError):
+        return None
+    for meta in root.iter("meta"):
+        if meta.get(attr) == value and meta.get("content"):
+            return meta.get("content")
+    return None
+
+def _fetch_thumbnail_from_web(url, blog_name="Web", throttle=None):
+    """(썸네일 URL 또는 None, 결과를 캐시해도 되는지)를 반환합니다."""
+    try:
+        with get_http_client().get(url, timeout=10, stream=True, throttle=throttle) as response:
+            if response.status_code != 200:
+                # Common anti-bot codes
+                if response.status_code in [403, 401, 429]:
+                     print(f"⚠️ [{blog_name} Thumbnail] Access Denied ({response.status_code}): {url}")
+                else:
+                     print(f"⚠️ [{blog_name} Thumbnail] Fetch failed ({response.status_code}): {url}")
+                # 429/5xx는 일시적인 상태이므로 실패로 기억하지 않습니다.
+                return None, response.status_code != 429 and response.status_code < 500
+
+            # 메타 태그는 <head>에 있으므로 본문 전체를 받지 않고 </head>까지만 읽어 파싱합니다.
+            head_html = read_html_head(response)
 
         # og:image
-        # og:image
-        og_image = soup.find("meta", attrs={"property": "og:image"})
-        if og_image and og_image.get("content"):
-            img_url = urljoin(url, og_image["content"])
+        og_image = find_meta_content(head_html, "property", "og:image")
+        if og_image:
+            img_url = urljoin(url, og_image)
             print(f"✅ [{blog_name} Thumbnail] Extracted from Web: {img_url}")
-            return img_url
+            return img_url, True
 
         # twitter:image
-        twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
-        if twitter_image and twitter_image.get("content"):
-             img_url = urljoin(url, twitter_image["content"])
+        twitter_image = find_meta_content(head_html, "name", "twitter:image")
+        if twitter_image:
+             img_url = urljoin(url, twitter_image)
              print(f"✅ [{blog_name} Thumbnail] Extracted from Twitter Meta: {img_url}")
-             return img_url
+             return img_url, True
 
         print(f"❌ [{blog_name} Thumbnail] No meta image found: {url}")
-        return None
+        return None, True
     except Exception as e:
+        # 타임아웃/연결 오류는 일시적일 수 있으므로 캐시하지 않습니다.
         print(f"❌ [{blog_name} Thumbnail] Web fetch failed: {e}")
-        return None
+        return None, False
 
-def extract_thumbnail(entry, feed_config=None):
-    # Web Scraping Blogs list
-    web_scraping_domains = [
-        "toss.tech", "oliveyoung.tech", "tech.kakao.com", "tech.kakaopay.com",
-        "techblog.woowahan.com", "blog.banksalad.com", "tech.devsisters.com",
-        "d2.naver.com", "techblog.lycorp.co.jp"
-    ]
+def fetch_thumbnail_from_web(url, blog_name="Web", throttle=None):
+    """
+    URL 기준 썸네일 캐시를 먼저 확인합니다. 성공 결과는 THUMBNAIL_CACHE_TTL_DAYS 동안,
+    차단(403 등)/메타 없음 같은 실패는 THUMBNAIL_NEGATIVE_TTL_HOURS 동안 재요청하지 않습니다.
+    """
+    key = normalize_url(url)
+    cache = get_thumbnail_cache()
 
+    try:
+        cached = cache.get(key)
+    except Exception as e:
+        print(f"⚠️ [{blog_name} Thumbnail] Cache lookup failed: {e}")
+        cached = None
+
+    if cached is not None:
+        return cached.get("thumbnail")
+
+    thumbnail, cacheable = _fetch_thumbnail_from_web(url, blog_name, throttle)
+    if cacheable:
+        ttl = THUMBNAIL_CACHE_TTL_DAYS * 86400 if thumbnail else THUMBNAIL_NEGATIVE_TTL_HOURS * 3600
+        try:
+            cache.set(key, {"thumbnail": thumbnail}, ttl_seconds=ttl)
+        except Exception as e:
+            print(f"⚠️ [{blog_name} Thumbnail] Cache write failed: {e}")
+    return thumbnail
+
+WEB_SCRAPING_DOMAINS = [
+    "toss.tech", "oliveyoung.tech", "tech.kakao.com", "tech.kakaopay.com",
+    "techblog.woowahan.com", "blog.banksalad.com", "tech.devsisters.com",
+    "d2.naver.com", "techblog.lycorp.co.jp"
+]
+
+def needs_web_thumbnail(link):
+    """og:image를 위해 원문 페이지를 스크래핑해야 하는 블로그인지 확인합니다."""
+    return any(domain in (link or "") for domain in WEB_SCRAPING_DOMAINS)
+
+def extract_thumbnail(entry, feed_config=None):
     link = entry.get("link", "")
 
     # Check if scraping is needed
-    for domain in web_scraping_domains:
-        if domain in link:
-            blog_name = feed_config.get("name", "Unknown") if feed_config else "Unknown"
-            print(f"🔍 [{blog_name} Thumbnail] Attempting web scraping: {link}")
-            thumb = fetch_thumbnail_from_web(link, blog_name)
-            if thumb:
-                return thumb
-            break
+    if needs_web_thumbnail(link):
+        blog_name = feed_config.get("name", "Unknown") if feed_config else "Unknown"
+        print(f"🔍 [{blog_name} Thumbnail] Attempting web scraping: {link}")
+        thumb = fetch_thumbnail_from_web(link, blog_name)
+        if thumb:
+            return thumb
+
+    return extract_feed_thumbnail(entry)
+
+def extract_feed_thumbnail(entry, processed=None):
+    """
+    네트워크 요청 없이 피드 항목(enclosure, media, 본문 img)에서만 썸네일을 찾습니다.
+    processed(process_entry_html 결과)가 주어지면 본문을 다시 파싱하지 않고 그 이미지를 사용합니다.
+    """
+    link = entry.get("link", "")
 
     # 1. Enclosure
     if "enclosures" in entry:
@@ -134,15 +345,10 @@ def extract_thumbnail(entry, feed_config=None):
             return entry.media_thumbnail[0].get("url")
 
     # 4. Content Image Extraction
-    content = ""
-    if "content" in entry and len(entry.content) > 0:
-        content = entry.content[0].value
-    elif "summary" in entry:
-        content = entry.summary
-    elif "description" in entry:
-        content = entry.description
+    if processed is not None:
+        return processed.image
 
-    soup = BeautifulSoup(content, "lxml")
+    soup = BeautifulSoup(entry_html(entry), "lxml")
 
     # Special Logics (Naver, Tistory, Velog)
     if "blog.naver.com" in link:
@@ -150,23 +356,35 @@ def extract_thumbnail(entry, feed_config=None):
         # Python's soup.find_all('img') is easier
         pass
 
-    imgs = soup.find_all("img")
-    for img in imgs:
-        src = img.get("src") or img.get("data-src")
-        if not src:
-            continue
+    for img in soup.find_all("img"):
+        src = usable_image_src(img.get("src") or img.get("data-src"), link)
+        if src:
+            return src
 
-        if src.startswith("data:"):
-            continue
+    return None
 
-        # Convert relative to absolute
-        if not src.startswith("http"):
-             src = urljoin(link, src)
+def entry_html(entry):
+    if "content" in entry and len(entry.content) > 0:
+        return entry.content[0].value
+    elif "summary" in entry:
+        return entry.summary
+    elif "description" in entry:
+        return entry.description
+    return ""
+
+def usable_image_src(src, link):
+    if not src:
+        return None
 
-        # Naver specific clean up
-        if "blog.naver.com" in link:
-            src = src.split("?")[0]
+    if src.startswith("data:"):
+        return None
 
-        return src
+    # Convert relative to absolute
+    if not src.startswith("http"):
+         src = urljoin(link, src)
 
-    return None
+    # Naver specific clean up
+    if "blog.naver.com" in link:
+        src = src.split("?")[0]
+
+    return src
@@ -0,0 +1,106 @@
+import re
+
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+SKIP_TAGS = {"script", "style", "noscript", "template", "iframe", "head", "button", "svg", "form", "select"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "center", "dd", "div", "dl", "dt", "figure", "figcaption",
+    "footer", "header", "main", "nav", "ol", "p", "pre", "section", "table", "tbody", "thead", "tfoot", "ul",
+}
+BOLD_TAGS = {"strong", "b"}
+SPACES_PATTERN = re.compile(r"[ \t\r\f\v ]+")
+
+
+def _flush(buffer: list[str], out: list[str]) -> None:
+    lines = [SPACES_PATTERN.sub(" ", line).strip() for line in "".join(buffer).split("\n")]
+    lines = [line for line in lines if line]
+    if lines:
+        out.append("\n".join(lines))
+    buffer.clear()
+
+
+def _inline_text(node: Tag) -> str:
+    buffer: list[str] = []
+    out: list[str] = []
+    _walk(node, out, buffer)
+    _flush(buffer, out)
+    return " ".join(" ".join(out).split("\n")).strip()
+
+
+def _is_data_row(cells: list[Tag]) -> bool:
+    # 레이아웃용 표(셀 안에 문단/목록/표가 있는 경우)는 표로 옮기지 않고 일반 블록으로 펼칩니다.
+    return len(cells) >= 2 and not any(
+        cell.find(list(BLOCK_TAGS | set(HEADING_LEVELS) | {"li", "table"})) for cell in cells
+    )
+
+
+def _walk(node: Tag, out: list[str], buffer: list[str]) -> None:
+    for child in node.children:
+        if isinstance(child, Comment):
+            continue
+        if isinstance(child, NavigableString):
+            buffer.append(str(child))
+            continue
+        if not isinstance(child, Tag) or child.name in SKIP_TAGS:
+            continue
+
+        name = child.name
+        if name == "br":
+            buffer.append("\n")
+        elif name in HEADING_LEVELS:
+            _flush(buffer, out)
+            text = _inline_text(child)
+            if text:
+                out.append(f"{'#' * HEADING_LEVELS[name]} {text}")
+        elif name in BOLD_TAGS:
+            text = _inline_text(child)
+            if text:
+                buffer.append(f" **{text}** ")
+        elif name == "li":
+            _flush(buffer, out)
+            item_blocks: list[str] = []
+            item_buffer: list[str] = []
+            _walk(child, item_blocks, item_buffer)
+            _flush(item_buffer, item_blocks)
+            lines = [line for block in item_blocks for line in block.split("\n")]
+            if lines:
+                out.append("\n".join([f"- {lines[0]}"] + [f"  {line}" for line in lines[1:]]))
+        elif name == "tr":
+            _flush(buffer, out)
+            cells = child.find_all(["td", "th"], recursive=False)
+            if _is_data_row(cells):
+                out.append("| " + " | ".join(_inline_text(cell).replace("|", "/") for cell in cells) + " |")
+            else:
+                for cell in cells or [child]:
+                    _walk(cell, out, buffer)
+                    _flush(buffer, out)
+        elif name in BLOCK_TAGS or name in ("td", "th"):
+            _flush(buffer, out)
+            _walk(child, out, buffer)
+            _flush(buffer, out)
+        else:
+            _walk(child, out, buffer)
+
+
+def html_to_markdown(html) -> str:
+    """
+    HTML(문자열 또는 BeautifulSoup 노드)을 LLM 입력/규칙 추출용 간단한 마크다운으로 바꿉니다.
+    제목(h1~h6), 목록, 굵은 글씨, 줄바꿈, 데이터 표만 옮기고 이미지/링크 주소/스크립트는 버립니다.
+    """
+    if html is None:
+        return ""
+    root = BeautifulSoup(html, "html.parser") if isinstance(html, str) else html
+    out: list[str] = []
+    buffer: list[str] = []
+    _walk(root, out, buffer)
+    _flush(buffer, out)
+
+    # 연속된 목록 항목은 빈 줄 없이 한 목록으로 붙입니다.
+    blocks: list[str] = []
+    for block in out:
+        if blocks and block.startswith("- ") and blocks[-1].startswith("- "):
+            blocks[-1] += "\n" + block
+        else:
+            blocks.append(block)
+    return "\n\n".join(blocks)
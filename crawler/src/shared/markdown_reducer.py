@@ -0,0 +1,164 @@
+import math
+import re
+from dataclasses import dataclass
+
+IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]*\)|<img\b[^>]*>", re.IGNORECASE)
+LINK_PATTERN = re.compile(r"\[([^\]]*)\]\([^)\s]*(?:\s+\"[^\"]*\")?\)")
+AUTOLINK_PATTERN = re.compile(r"<https?://[^>]+>")
+BARE_URL_LINE_PATTERN = re.compile(r"^\s*(?:[-*+]\s+)?https?://\S+\s*$")
+LIST_MARKER_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+# 메뉴/버튼처럼 한 줄 전체가 이 문구뿐이면 제거합니다.
+BOILERPLATE_LINES = {
+    "skip to content", "skip to main content", "menu", "메뉴", "로그인", "회원가입", "login", "sign in",
+    "sign up", "검색", "search", "top", "맨 위로", "이전", "다음", "이전 글", "다음 글", "공유하기", "share",
+    "바로가기", "read more", "더보기", "더 보기", "go to apply", "apply now", "지원하기", "shortcut",
+    "목록", "목록으로", "닫기", "close", "홈", "home",
+}
+# 이 표현이 들어간 짧은 줄은 푸터/쿠키 배너로 보고 제거합니다.
+FOOTER_MARKERS = (
+    "copyright", "©", "all rights reserved", "개인정보처리방침", "개인정보 처리방침", "이용약관",
+    "cookie policy", "cookie settings", "accept cookies", "사업자등록번호", "통신판매업",
+)
+YOUTUBE_MARKERS = (
+    "watch on youtube", "youtube에서 보기", "watch later", "copy link", "tap to unmute",
+    "if playback doesn't begin", "you're signed out", "videos you watch may be added", "more videos",
+    "include playlist", "an error occurred while retrieving sharing information",
+)
+SHORT_LINE_CHARS = 200
+
+
+@dataclass
+class ReducedContent:
+    text: str
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def saved_ratio(self) -> float:
+        return 1 - self.tokens_after / self.tokens_before if self.tokens_before else 0.0
+
+    def report(self) -> str:
+        return f"{self.tokens_before} → {self.tokens_after} tokens (-{self.saved_ratio * 100:.0f}%)"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 호출 없이 쓰는 대략적인 토큰 수 추정치입니다.
+    ASCII는 4자당 1토큰, 한글 등 비ASCII 문자는 1.5자당 1토큰으로 계산합니다.
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5)
+
+
+def is_link_only_line(line: str) -> bool:
+    stripped = LIST_MARKER_PATTERN.sub("", line).strip()
+    if not stripped:
+        return False
+    if BARE_URL_LINE_PATTERN.match(stripped):
+        return True
+    without_links = LINK_PATTERN.sub("", IMAGE_PATTERN.sub("", stripped))
+    return stripped != without_links and not re.search(r"\w", without_links)
+
+
+def is_boilerplate_line(line: str) -> bool:
+    text = WHITESPACE_PATTERN.sub(" ", LIST_MARKER_PATTERN.sub("", line)).strip(" #*_>|").lower()
+    if not text:
+        return False
+    if text in BOILERPLATE_LINES:
+        return True
+    if len(text) <= SHORT_LINE_CHARS:
+        return any(marker in text for marker in FOOTER_MARKERS + YOUTUBE_MARKERS)
+    return False
+
+
+def clean_markdown(markdown: str) -> str:
+    """링크만 모인 메뉴 블록, 링크/이미지 마크업, 푸터/유튜브 플레이어 문구, 중복 줄을 제거합니다."""
+    blocks = re.split(r"\n\s*\n", markdown.replace("\r\n", "\n"))
+    seen_lines: set[str] = set()
+    kept_blocks = []
+
+    for block in blocks:
+        lines = [line for line in block.split("\n") if line.strip()]
+        if not lines:
+            continue
+
+        # 대부분의 줄이 링크뿐인 블록은 내비게이션/관련 글 목록으로 봅니다.
+        link_lines = sum(1 for line in lines if is_link_only_line(line))
+        if len(lines) >= 3 and link_lines / len(lines) >= 0.6:
+            continue
+
+        kept_lines = []
+        for line in lines:
+            if is_link_only_line(line) or is_boilerplate_line(line):
+                continue
+
+            line = IMAGE_PATTERN.sub("", line)
+            line = LINK_PATTERN.sub(r"\1", line)
+            line = AUTOLINK_PATTERN.sub("", line).rstrip()
+            if not line.strip():
+                continue
+
+            # 표 구분선처럼 글자가 없는 줄은 중복이어도 유지합니다.
+            normalized = WHITESPACE_PATTERN.sub(" ", line).strip().lower()
+            if re.search(r"\w", normalized):
+                if normalized in seen_lines:
+                    continue
+                seen_lines.add(normalized)
+            kept_lines.append(line)
+
+        if kept_lines:
+            kept_blocks.append("\n".join(kept_lines))
+
+    return BLANK_LINES_PATTERN.sub("\n\n", "\n\n".join(kept_blocks)).strip()
+
+
+def pack_to_budget(text: str, token_budget: int) -> str:
+    """문서 순서대로 블록을 담다가 예산을 넘으면 마지막 블록은 줄/글자 단위로 잘라 채웁니다."""
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    packed = []
+    used = 0
+    for block in text.split("\n\n"):
+        cost = estimate_tokens(block) + 1
+        if used + cost <= token_budget:
+            packed.append(block)
+            used += cost
+            continue
+
+        partial = []
+        for line in block.split("\n"):
+            line_cost = estimate_tokens(line) + 1
+            if used + line_cost > token_budget:
+                remaining = token_budget - used
+                if remaining > 8:
+                    # 비율로 대략 자른 뒤 예산 안에 들어올 때까지 줄입니다.
+                    cut = line[: max(1, int(len(line) * remaining / line_cost))]
+                    while cut and estimate_tokens(cut) > remaining:
+                        cut = cut[: int(len(cut) * 0.9)]
+                    if cut:
+                        partial.append(cut)
+                break
+            partial.append(line)
+            used += line_cost
+        if partial:
+            packed.append("\n".join(partial))
+        break
+
+    return "\n\n".join(packed)
+
+
+def reduce_markdown(markdown: str, token_budget: int) -> ReducedContent:
+    """
+    LLM 프롬프트에 넣기 전 Firecrawl 마크다운을 정리하고 token_budget(추정치) 안에 맞춥니다.
+    앞에서부터 글자 수로 자르던 방식과 달리, 메뉴/푸터 같은 잡음을 먼저 걷어내 실제 본문이 예산에 들어가도록 합니다.
+    """
+    markdown = markdown or ""
+    tokens_before = estimate_tokens(markdown)
+    text = pack_to_budget(clean_markdown(markdown), max(1, token_budget))
+    return ReducedContent(text=text, tokens_before=tokens_before, tokens_after=estimate_tokens(text))
@@ -0,0 +1,130 @@
+import threading
+
+from firecrawl import FirecrawlApp
+from loguru import logger
+
+from src.common.config.settings import (
+    FIRECRAWL_API_KEY,
+    FIRECRAWL_CACHE_MAX_ENTRIES,
+    FIRECRAWL_CACHE_PATH,
+    FIRECRAWL_CACHE_TTL_DAYS,
+)
+from src.common.http import get_rate_limiter
+from src.common.llm import is_quota_error
+from src.common.storage.cache_repo import SqliteCacheRepository
+from src.shared.database import normalize_url
+
+
+class ScrapeError(Exception):
+    """Firecrawl 스크래핑에 실패했을 때 발생합니다."""
+
+
+class FirecrawlUnavailableError(ScrapeError):
+    """FIRECRAWL_API_KEY가 없어 스크래핑할 수 없을 때 발생합니다."""
+
+
+def extract_markdown(scrape_result) -> str:
+    # Handle object or dict response
+    if isinstance(scrape_result, dict):
+        return scrape_result.get("markdown", "") or scrape_result.get("content", "")
+    if hasattr(scrape_result, "markdown"):
+        return scrape_result.markdown or ""
+    # 알 수 없는 형식을 문자열로 바꾸면 객체 repr이 본문으로 캐시/분석되므로 빈 결과로 처리합니다.
+    logger.warning(f"⚠️ Unexpected Firecrawl response format: {type(scrape_result).__name__}")
+    return ""
+
+
+class FirecrawlScraper:
+    """
+    모든 앱이 공유하는 Firecrawl 스크래퍼입니다. 정규화 URL을 키로 마크다운 결과를 압축해
+    SQLite에 캐시하므로(TTL + 최대 항목 수 LRU), 같은 페이지를 다시 수집해도 Firecrawl 크레딧을 쓰지 않습니다.
+    refresh=True이면 캐시를 읽지 않고 새로 스크래핑한 결과로 캐시를 갱신합니다.
+    """
+
+    def __init__(self, api_key: str | None = FIRECRAWL_API_KEY, cache: SqliteCacheRepository | None = None):
+        self.api_key = api_key
+        self.refresh = False
+        self._cache = cache
+        self._client: FirecrawlApp | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> SqliteCacheRepository:
+        with self._lock:
+            if self._cache is None:
+                self._cache = SqliteCacheRepository(
+                    FIRECRAWL_CACHE_PATH,
+                    namespace="firecrawl",
+                    ttl_seconds=FIRECRAWL_CACHE_TTL_DAYS * 86400,
+                    max_entries=FIRECRAWL_CACHE_MAX_ENTRIES,
+                    compress=True,
+                )
+            return self._cache
+
+    def client(self) -> FirecrawlApp:
+        if not self.api_key:
+            raise FirecrawlUnavailableError("FIRECRAWL_API_KEY is missing.")
+        with self._lock:
+            if self._client is None:
+                self._client = FirecrawlApp(api_key=self.api_key)
+            return self._client
+
+    def scrape_markdown(self, url: str, refresh: bool | None = None) -> str:
+        """URL의 마크다운을 반환합니다. 실패하면 ScrapeError를 발생시킵니다."""
+        refresh = self.refresh if refresh is None else refresh
+        key = normalize_url(url)
+
+        if not refresh:
+            try:
+                cached = self.cache.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Firecrawl cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                logger.info(f"   💾 Firecrawl cache hit: {url}")
+                return cached["markdown"]
+
+        client = self.client()
+        limiter = get_rate_limiter("firecrawl")
+        limiter.acquire()
+        try:
+            # Firecrawl v1/v2 uses .scrape()
+            markdown = extract_markdown(client.scrape(url, formats=["markdown"]))
+        except Exception as e:
+            if is_quota_error(e):
+                limiter.on_throttle()
+            raise ScrapeError(str(e)) from e
+        limiter.on_success()
+
+        if markdown:
+            try:
+                self.cache.set(key, {"url": url, "markdown": markdown})
+            except Exception as e:
+                logger.warning(f"⚠️ Firecrawl cache write failed: {e}")
+        return markdown
+
+
+_scraper: FirecrawlScraper | None = None
+_scraper_lock = threading.Lock()
+
+
+def get_firecrawl_scraper() -> FirecrawlScraper:
+    global _scraper
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = FirecrawlScraper()
+        return _scraper
+
+
+def scrape_url_content(url: str):
+    """
+    Uses Firecrawl to scrape the given URL and return Markdown content.
+    Returns None on failure (missing API key, Firecrawl error).
+    """
+    try:
+        return get_firecrawl_scraper().scrape_markdown(url)
+    except FirecrawlUnavailableError as e:
+        logger.warning(f"⚠️ {e}")
+    except ScrapeError as e:
+        logger.error(f"❌ Firecrawl failed for {url}: {e}")
+    return None
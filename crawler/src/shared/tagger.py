@@ -1,9 +1,22 @@
+import hashlib
+import json
 import os
-import time
-import google.generativeai as genai
+import re
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
-from src.common.config.settings import GEMINI_API_KEY, TAG_RETRY_BASE_MS
+from src.common.config.settings import (
+    GEMINI_API_KEY,
+    TAG_BATCH_SIZE,
+    TAG_CACHE_MAX_ENTRIES,
+    TAG_CACHE_PATH,
+    TAG_CACHE_TTL_DAYS,
+)
+from src.common.llm import LLMQuotaError, get_gemini_client
+from src.common.storage.cache_repo import SqliteCacheRepository
+
+TAG_MODEL = "gemini-2.5-flash"
+# 프롬프트나 허용 태그 목록이 바뀌면 올려서 기존 캐시를 무효화합니다.
+TAG_PROMPT_VERSION = "v1"
 
 ALLOWED_TAGS = [
     # 프론트엔드
@@ -20,6 +33,45 @@ ALLOWED_TAGS = [
     "career", "culture", "business", "product", "ad", "case-study",
 ]
 
+_tag_cache = None
+
+def get_tag_cache():
+    global _tag_cache
+    if _tag_cache is None:
+        _tag_cache = SqliteCacheRepository(
+            TAG_CACHE_PATH,
+            namespace="tags",
+            ttl_seconds=TAG_CACHE_TTL_DAYS * 86400,
+            max_entries=TAG_CACHE_MAX_ENTRIES,
+        )
+    return _tag_cache
+
+def tag_cache_key(article):
+    payload = json.dumps(
+        [
+            article.get("title", ""),
+            article.get("summary", ""),
+            article.get("author", ""),
+            TAG_PROMPT_VERSION,
+            TAG_MODEL,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def get_cached_tags(article):
+    try:
+        return get_tag_cache().get(tag_cache_key(article))
+    except Exception as e:
+        print(f"⚠️ Tag cache lookup failed: {e}")
+        return None
+
+def store_cached_tags(article, tags):
+    try:
+        get_tag_cache().set(tag_cache_key(article), tags)
+    except Exception as e:
+        print(f"⚠️ Tag cache write failed: {e}")
+
 def merge_and_dedupe(tags):
     normalized = []
     for tag in tags:
@@ -51,76 +103,143 @@ Allowed List: {allowed}
 Output Format: Comma-separated list only. No extra text.
 """.strip()
 
-def generate_with_gemini(prompt, retry_count=0):
-    if not GEMINI_API_KEY:
+def build_batch_prompt(articles):
+    allowed = ", ".join(ALLOWED_TAGS)
+    lines = []
+    for index, article in enumerate(articles):
+        lines.append(
+            f"[{index}] Title: {article.get('title', '')} | "
+            f"Author/Blog: {article.get('author', '')} | "
+            f"Summary: {article.get('summary', '')}"
+        )
+    listing = "\n".join(lines)
+    return f"""
+You are a concise tagger for a tech blog aggregator.
+Articles:
+{listing}
+
+Task: For EACH article, choose 3-6 tags that best describe it from the allowed list.
+Allowed List: {allowed}
+
+Output Format: JSON array only, one object per article, using the bracketed index.
+[{{"index": 0, "tags": ["tag1", "tag2"]}}]
+""".strip()
+
+def parse_batch_tags(text, count):
+    """
+    배치 응답(JSON 배열)을 인덱스별 태그 리스트로 변환합니다.
+    누락되었거나 형식이 잘못된 항목은 None으로 남깁니다.
+    """
+    results = [None] * count
+    if not text:
+        return results
+
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.replace("```json", "").replace("```", "").strip()
+
+    try:
+        data = json.loads(cleaned)
+    except ValueError:
+        return results
+
+    if isinstance(data, dict):
+        data = data.get("results") or data.get("articles") or []
+    if not isinstance(data, list):
+        return results
+
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        index = item.get("index")
+        tags = item.get("tags")
+        if not isinstance(index, int) or not 0 <= index < count or not isinstance(tags, list):
+            continue
+        filtered = [tag for tag in merge_and_dedupe(tags) if tag in ALLOWED_TAGS]
+        results[index] = filtered[:6] or None
+    return results
+
+TAG_SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+}
+
+def generate_with_gemini(prompt, json_mode=False):
+    client = get_gemini_client()
+    if not client.available:
         print("⚠️ GEMINI_API_KEY is missing via config.")
         return ""
 
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash")
-
-        response = model.generate_content(
+        # 최초 시도 + 429 재시도 3회
+        return client.generate_text(
             prompt,
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            }
+            TAG_MODEL,
+            json_mode=json_mode,
+            max_retries=4,
+            safety_settings=TAG_SAFETY_SETTINGS,
         )
-        return response.text
+    except LLMQuotaError as e:
+        print(f"❌ Max retries exceeded for Gemini: {e}")
     except Exception as e:
-        error_msg = str(e)
-        if "429" in error_msg or "quota" in error_msg.lower():
-            if retry_count < 3:
-                wait_time = (2 ** retry_count) * TAG_RETRY_BASE_MS / 1000.0
-                print(f"⏳ Rate Limit hit. Retrying in {wait_time}s... (Attempt {retry_count + 1}/3)")
-                time.sleep(wait_time)
-                return generate_with_gemini(prompt, retry_count + 1)
-            else:
-                print(f"❌ Max retries exceeded for Gemini: {error_msg}")
-        else:
-            print(f"❌ Gemini request failed: {e}")
-        return ""
+        print(f"❌ Gemini request failed: {e}")
+    return ""
 
 
+FALLBACK_KEYWORD_MAP = {
+    "react": "react", "next": "nextjs", "vue": "frontend", "angular": "frontend",
+    "javascript": "javascript", "typescript": "typescript", "css": "css",
+    "spring": "spring", "java": "java", "node": "nodejs", "nodejs": "nodejs", "express": "nodejs",
+    "nest": "nestjs", "nestjs": "nestjs", "python": "python", "django": "python", "flask": "python", "fastapi": "python",
+    "go": "go", "golang": "go", "rust": "backend", "c++": "backend", "c#": "backend", "php": "backend", "laravel": "backend",
+    "aws": "cloud", "azure": "cloud", "gcp": "cloud", "docker": "docker", "k8s": "kubernetes",
+    "kubernetes": "kubernetes", "ci/cd": "cicd", "jenkins": "cicd", "github actions": "cicd", "git": "devops",
+    "myql": "database", "postgresql": "database", "postgres": "database", "oracle": "database", "mongodb": "database", "redis": "database",
+    "kafka": "backend", "rabbitmq": "backend", "elastic": "backend", "elasticsearch": "backend",
+    "linux": "devops", "ubuntu": "devops", "jira": "cooperation", "confluence": "cooperation", "slack": "cooperation",
+    "ai": "ai", "llm": "llm", "gpt": "genai", "machine learning": "ai-ml",
+    "design": "design", "ux": "ui/ux", "ui": "ui/ux",
+    "career": "career", "interview": "career", "salary": "career",
+    "startup": "business", "agile": "culture", "scrum": "culture"
+}
+
+def _is_word_char(char):
+    return char.isascii() and char.isalnum()
+
+# 모든 키워드를 하나의 정규식으로 묶어 텍스트를 한 번만 훑습니다.
+# 전방탐색 안에서 캡처하므로 매치가 문자를 소비하지 않아, 겹치는 키워드(예: "github actions" 안의 단어)도 모두 찾습니다.
+# 긴 키워드를 먼저 시도해 "elastic"/"elasticsearch"처럼 접두사가 같은 경우에도 경계 판정이 기존과 같습니다.
+_FALLBACK_PATTERN = re.compile(
+    r"(?<![a-zA-Z0-9])(?=("
+    + "|".join(re.escape(keyword) for keyword in sorted(FALLBACK_KEYWORD_MAP, key=len, reverse=True))
+    + r")(?![a-zA-Z0-9]))"
+)
+_FALLBACK_KEYWORD_ORDER = {keyword: index for index, keyword in enumerate(FALLBACK_KEYWORD_MAP)}
+# 한 위치에서는 가장 긴 키워드만 캡처되므로, 그 키워드 안에서 경계로 끝나는 짧은 키워드(예: "ci/cd"의 "ci")를 함께 기록합니다.
+_FALLBACK_IMPLIED_KEYWORDS = {
+    keyword: [
+        other for other in FALLBACK_KEYWORD_MAP
+        if len(other) < len(keyword) and keyword.startswith(other) and not _is_word_char(keyword[len(other)])
+    ]
+    for keyword in FALLBACK_KEYWORD_MAP
+}
+
 def generate_tags_fallback(title, summary, author):
     """
     AI API 호출 실패 시 사용하는 단순 키워드 매칭 대체 로직입니다.
     """
     combined_text = (title + " " + summary).lower()
-    found_tags = []
-
-    keyword_map = {
-        "react": "react", "next": "nextjs", "vue": "frontend", "angular": "frontend",
-        "javascript": "javascript", "typescript": "typescript", "css": "css",
-        "spring": "spring", "java": "java", "node": "nodejs", "nodejs": "nodejs", "express": "nodejs",
-        "nest": "nestjs", "nestjs": "nestjs", "python": "python", "django": "python", "flask": "python", "fastapi": "python",
-        "go": "go", "golang": "go", "rust": "backend", "c++": "backend", "c#": "backend", "php": "backend", "laravel": "backend",
-        "aws": "cloud", "azure": "cloud", "gcp": "cloud", "docker": "docker", "k8s": "kubernetes",
-        "kubernetes": "kubernetes", "ci/cd": "cicd", "jenkins": "cicd", "github actions": "cicd", "git": "devops",
-        "myql": "database", "postgresql": "database", "postgres": "database", "oracle": "database", "mongodb": "database", "redis": "database",
-        "kafka": "backend", "rabbitmq": "backend", "elastic": "backend", "elasticsearch": "backend",
-        "linux": "devops", "ubuntu": "devops", "jira": "cooperation", "confluence": "cooperation", "slack": "cooperation",
-        "ai": "ai", "llm": "llm", "gpt": "genai", "machine learning": "ai-ml",
-        "design": "design", "ux": "ui/ux", "ui": "ui/ux",
-        "career": "career", "interview": "career", "salary": "career",
-        "startup": "business", "agile": "culture", "scrum": "culture"
-    }
-
-    import re
-
-    # 성능을 위해 정규식 패턴을 미리 컴파일할까요?
-    # 현재는 리스트가 작으므로 단순 반복문으로도 충분합니다.
-
-    for keyword, tag in keyword_map.items():
-        # 단순 단어들이지만 만약을 위해 키워드를 이스케이프 처리합니다
-        pattern = r"(?<![a-zA-Z0-9])" + re.escape(keyword) + r"(?![a-zA-Z0-9])"
-        # 결합된 텍스트에서 검색
-        if re.search(pattern, combined_text):
-            found_tags.append(tag)
 
+    found = set()
+    for match in _FALLBACK_PATTERN.finditer(combined_text):
+        keyword = match.group(1)
+        found.add(keyword)
+        found.update(_FALLBACK_IMPLIED_KEYWORDS[keyword])
+
+    # 결과 순서는 텍스트 등장 순서가 아닌 키워드 맵 순서를 따릅니다.
+    found_tags = [FALLBACK_KEYWORD_MAP[keyword] for keyword in sorted(found, key=_FALLBACK_KEYWORD_ORDER.__getitem__)]
     return merge_and_dedupe(found_tags)[:5]
 
 def generate_tags_for_article(article):
@@ -131,6 +250,10 @@ def generate_tags_for_article(article):
         print("⚠️ GEMINI_API_KEY missing - using fallback.")
         return generate_tags_fallback(article.get("title", ""), article.get("summary", ""), article.get("author", ""))
 
+    cached = get_cached_tags(article)
+    if cached is not None:
+        return cached
+
     try:
         prompt = build_prompt(
             title=article.get("title", ""),
@@ -152,11 +275,54 @@ def generate_tags_for_article(article):
         if not result:
              return generate_tags_fallback(article.get("title", ""), article.get("summary", ""), article.get("author", ""))
 
+        store_cached_tags(article, result)
         return result
     except Exception as e:
         print(f"❌ Error generating tags: {e}")
         return []
 
+def generate_tags_for_articles(articles, batch_size=TAG_BATCH_SIZE):
+    """
+    여러 글을 한 번의 Gemini 호출(JSON 응답)로 태깅합니다. 태그 캐시에 있는 글은 호출에서 제외합니다.
+    결과는 입력 순서와 같은 태그 리스트의 리스트이며, 응답에서 누락된 항목은
+    generate_tags_fallback으로 개별 대체합니다.
+    """
+    def fallback(article):
+        return generate_tags_fallback(article.get("title", ""), article.get("summary", ""), article.get("author", ""))
+
+    if not articles:
+        return []
+
+    if not GEMINI_API_KEY:
+        print("⚠️ GEMINI_API_KEY missing - using fallback.")
+        return [fallback(article) for article in articles]
+
+    results = [get_cached_tags(article) for article in articles]
+    pending = [index for index, tags in enumerate(results) if tags is None]
+
+    batch_size = max(1, batch_size)
+    for start in range(0, len(pending), batch_size):
+        indices = pending[start:start + batch_size]
+        chunk = [articles[index] for index in indices]
+        try:
+            text = generate_with_gemini(build_batch_prompt(chunk), json_mode=True)
+            parsed = parse_batch_tags(text, len(chunk))
+        except Exception as e:
+            print(f"❌ Error generating batch tags: {e}")
+            parsed = [None] * len(chunk)
+
+        missing = sum(1 for tags in parsed if tags is None)
+        if missing:
+            print(f"⚠️ {missing}/{len(chunk)} articles missing from batch response - using fallback tags.")
+        for index, article, tags in zip(indices, chunk, parsed):
+            if tags is None:
+                results[index] = fallback(article)
+            else:
+                store_cached_tags(article, tags)
+                results[index] = tags
+
+    return results
+
 def base_tags_from_feed_category(category):
     if not category:
         return []